@@ -0,0 +1,51 @@
+"""x strategy pattern/recommendation payloads as native json
+
+Revision ID: 20261018_0014
+Revises: 20260221_0013
+Create Date: 2026-10-18
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261018_0014"
+down_revision = "20260221_0013"
+branch_labels = None
+depends_on = None
+
+
+_JSON_COLUMNS = (
+    ("x_strategy_patterns", "pattern_json"),
+    ("x_strategy_recommendations", "recommendation_json"),
+)
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    # SQLite stores JSON as text already; only Postgres needs the column rewrite.
+    if not _is_postgresql():
+        return
+    for table_name, column_name in _JSON_COLUMNS:
+        op.execute(f"ALTER TABLE {table_name} ALTER COLUMN {column_name} DROP DEFAULT;")
+        op.execute(
+            f"ALTER TABLE {table_name} ALTER COLUMN {column_name} TYPE jsonb USING {column_name}::jsonb;"
+        )
+        op.execute(f"ALTER TABLE {table_name} ALTER COLUMN {column_name} SET DEFAULT '{{}}'::jsonb;")
+
+
+def downgrade() -> None:
+    if not _is_postgresql():
+        return
+    for table_name, column_name in _JSON_COLUMNS:
+        op.execute(f"ALTER TABLE {table_name} ALTER COLUMN {column_name} DROP DEFAULT;")
+        op.execute(
+            f"ALTER TABLE {table_name} ALTER COLUMN {column_name} TYPE text USING {column_name}::text;"
+        )
+        op.execute(f"ALTER TABLE {table_name} ALTER COLUMN {column_name} SET DEFAULT '{{}}';")
@@ -0,0 +1,49 @@
+"""x strategy pattern precomputed generated_at iso string
+
+Revision ID: 20261018_0015
+Revises: 20261018_0014
+Create Date: 2026-10-18
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261018_0015"
+down_revision = "20261018_0014"
+branch_labels = None
+depends_on = None
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    op.add_column(
+        "x_strategy_patterns",
+        sa.Column("generated_at_iso", sa.String(length=40), nullable=True),
+    )
+
+    # to_char() is not immutable, so Postgres rejects it in a GENERATED column;
+    # backfill once here and let the writer populate new rows. datetime.isoformat()
+    # omits the fraction when microseconds are zero, so the backfill does too.
+    if _is_postgresql():
+        op.execute(
+            sa.text(
+                "UPDATE x_strategy_patterns "
+                "SET generated_at_iso = to_char(generated_at AT TIME ZONE 'UTC', "
+                "CASE WHEN mod(date_part('microseconds', generated_at)::bigint, 1000000) = 0 "
+                "THEN 'YYYY-MM-DD\"T\"HH24:MI:SS\"+00:00\"' "
+                "ELSE 'YYYY-MM-DD\"T\"HH24:MI:SS.US\"+00:00\"' END) "
+                "WHERE generated_at_iso IS NULL"
+            )
+        )
+
+
+def downgrade() -> None:
+    op.drop_column("x_strategy_patterns", "generated_at_iso")
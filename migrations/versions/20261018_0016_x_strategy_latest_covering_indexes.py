@@ -0,0 +1,65 @@
+"""x strategy latest-row covering indexes
+
+Revision ID: 20261018_0016
+Revises: 20261018_0015
+Create Date: 2026-10-18
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261018_0016"
+down_revision = "20261018_0015"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # JSON payload columns are left out of INCLUDE: btree entries are capped at
+    # ~2.7kB and a large pattern would make inserts fail.
+    op.create_index(
+        "ix_x_strategy_patterns_workspace_generated_at_desc",
+        "x_strategy_patterns",
+        ["workspace_id", sa.text("generated_at DESC")],
+        unique=False,
+        postgresql_include=["period_window", "confidence_score", "generated_at_iso"],
+    )
+    op.drop_index("ix_x_strategy_patterns_workspace_generated_at", table_name="x_strategy_patterns")
+
+    op.create_index(
+        "ix_x_strategy_recommendations_workspace_created_at_desc",
+        "x_strategy_recommendations",
+        ["workspace_id", sa.text("created_at DESC")],
+        unique=False,
+        postgresql_include=["period_window"],
+    )
+    op.drop_index(
+        "ix_x_strategy_recommendations_workspace_created_at",
+        table_name="x_strategy_recommendations",
+    )
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_x_strategy_recommendations_workspace_created_at",
+        "x_strategy_recommendations",
+        ["workspace_id", "created_at"],
+        unique=False,
+    )
+    op.drop_index(
+        "ix_x_strategy_recommendations_workspace_created_at_desc",
+        table_name="x_strategy_recommendations",
+    )
+
+    op.create_index(
+        "ix_x_strategy_patterns_workspace_generated_at",
+        "x_strategy_patterns",
+        ["workspace_id", "generated_at"],
+        unique=False,
+    )
+    op.drop_index("ix_x_strategy_patterns_workspace_generated_at_desc", table_name="x_strategy_patterns")
@@ -0,0 +1,56 @@
+"""x strategy candidate queue and scan window indexes
+
+Revision ID: 20261018_0017
+Revises: 20261018_0016
+Create Date: 2026-10-18
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261018_0017"
+down_revision = "20261018_0016"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The pending queue orders by (score DESC, discovered_at DESC); carrying the
+    # tiebreaker lets a backward index scan satisfy ORDER BY ... LIMIT without a sort.
+    op.create_index(
+        "ix_x_strategy_discovery_workspace_status_score_discovered_at",
+        "x_strategy_discovery_candidates",
+        ["workspace_id", "status", "score", "discovered_at"],
+        unique=False,
+    )
+    op.drop_index(
+        "ix_x_strategy_discovery_workspace_status_score",
+        table_name="x_strategy_discovery_candidates",
+    )
+
+    # The scan window filters by workspace and captured_at across all watched accounts.
+    op.create_index(
+        "ix_x_competitor_posts_workspace_captured_at",
+        "x_competitor_posts",
+        ["workspace_id", "captured_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_x_competitor_posts_workspace_captured_at", table_name="x_competitor_posts")
+
+    op.create_index(
+        "ix_x_strategy_discovery_workspace_status_score",
+        "x_strategy_discovery_candidates",
+        ["workspace_id", "status", "score"],
+        unique=False,
+    )
+    op.drop_index(
+        "ix_x_strategy_discovery_workspace_status_score_discovered_at",
+        table_name="x_strategy_discovery_candidates",
+    )
@@ -0,0 +1,44 @@
+"""x competitor posts generated engagement_total column
+
+Revision ID: 20261018_0018
+Revises: 20261018_0017
+Create Date: 2026-10-18
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261018_0018"
+down_revision = "20261018_0017"
+branch_labels = None
+depends_on = None
+
+ENGAGEMENT_TOTAL_EXPRESSION = "like_count + reply_count + repost_count + quote_count"
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    # Postgres only supports STORED generated columns; SQLite can only add VIRTUAL
+    # ones through ALTER TABLE, which read the same way. The summed counters are all
+    # NOT NULL, so the generated value never is either.
+    op.add_column(
+        "x_competitor_posts",
+        sa.Column(
+            "engagement_total",
+            sa.Integer(),
+            sa.Computed(ENGAGEMENT_TOTAL_EXPRESSION, persisted=_is_postgresql()),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("x_competitor_posts", "engagement_total")
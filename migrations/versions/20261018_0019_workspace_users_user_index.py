@@ -0,0 +1,33 @@
+"""workspace users reverse lookup index
+
+Revision ID: 20261018_0019
+Revises: 20261018_0018
+Create Date: 2026-10-18
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261018_0019"
+down_revision = "20261018_0018"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # (workspace_id, user_id) is already served by uq_workspace_users_workspace_user;
+    # user-first lookups and the users.id cascade need their own index.
+    op.create_index(
+        "ix_workspace_users_user_id",
+        "workspace_users",
+        ["user_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_workspace_users_user_id", table_name="workspace_users")
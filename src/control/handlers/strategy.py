@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict
 from typing import TYPE_CHECKING
 
 from src.control.command_schema import ControlResponse
@@ -101,7 +102,7 @@ def handle_discover(context: "CommandContext") -> ControlResponse:
             message="strategy_discovery_criteria",
             data={
                 "workspace_id": workspace_id,
-                "criteria": get_strategy_discovery_criteria(),
+                "criteria": asdict(get_strategy_discovery_criteria()),
             },
         )
 
@@ -111,7 +112,7 @@ def handle_discover(context: "CommandContext") -> ControlResponse:
             workspace_id=workspace_id,
             limit=10,
         )
-        criteria = get_strategy_discovery_criteria()
+        criteria = asdict(get_strategy_discovery_criteria())
         items = []
         for row in rows:
             rationale = parse_discovery_candidate_rationale(row)
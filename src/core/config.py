@@ -35,6 +35,7 @@ class Settings(BaseSettings):
     x_publish_url: str = "https://api.twitter.com/2/tweets"
     x_users_me_url: str = "https://api.twitter.com/2/users/me"
     x_user_lookup_url: str = "https://api.twitter.com/2/users/{user_id}"
+    x_users_lookup_url: str = "https://api.twitter.com/2/users"
     x_user_tweets_url: str = "https://api.twitter.com/2/users/{user_id}/tweets"
     x_tweet_lookup_url: str = "https://api.twitter.com/2/tweets/{tweet_id}"
     x_api_timeout_seconds: int = 20
@@ -13,6 +13,10 @@ class XClientError(RuntimeError):
     """Raised when X API request fails."""
 
 
+# GET /2/users?ids= accepts at most 100 ids per request.
+USERS_LOOKUP_BATCH_SIZE = 100
+
+
 class XClient:
     def __init__(
         self,
@@ -30,6 +34,7 @@ class XClient:
         redirect_uri: str,
         timeout_seconds: int = 20,
         default_open_calls_query: str = "",
+        users_lookup_url: str = "",
     ) -> None:
         self.token_url = token_url
         self.authorize_url = authorize_url
@@ -44,6 +49,7 @@ class XClient:
         self.redirect_uri = redirect_uri
         self.timeout_seconds = timeout_seconds
         self.default_open_calls_query = default_open_calls_query
+        self.users_lookup_url = users_lookup_url
 
     def _safe_json(self, response: httpx.Response, *, context: str) -> Dict[str, Any]:
         try:
@@ -284,6 +290,67 @@ class XClient:
             raise XClientError("X user lookup response missing data")
         return data
 
+    def get_users_public_metrics_batch(
+        self,
+        *,
+        access_token: str,
+        user_ids: list[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        # Users the API does not return (suspended, deleted) are absent from the result,
+        # as are the ids of a chunk whose request failed.
+        if not access_token:
+            raise XClientError("Missing access token for X users lookup")
+        if not self.users_lookup_url.strip():
+            raise XClientError("X users lookup URL is not configured")
+
+        normalized_ids = list(dict.fromkeys(value.strip() for value in user_ids if value.strip()))
+        output: Dict[str, Dict[str, Any]] = {}
+        if not normalized_ids:
+            return output
+
+        # A failing chunk only drops its own ids, which callers report per user;
+        # the lookup raises only when every chunk failed.
+        first_error: Optional[XClientError] = None
+        succeeded_chunks = 0
+        with httpx.Client(timeout=self.timeout_seconds) as client:
+            for start in range(0, len(normalized_ids), USERS_LOOKUP_BATCH_SIZE):
+                chunk = normalized_ids[start : start + USERS_LOOKUP_BATCH_SIZE]
+                try:
+                    rows = self._lookup_users_chunk(client, access_token=access_token, user_ids=chunk)
+                except XClientError as exc:
+                    if first_error is None:
+                        first_error = exc
+                    continue
+                succeeded_chunks += 1
+                for row in rows:
+                    if isinstance(row, dict) and str(row.get("id") or "").strip():
+                        output[str(row["id"]).strip()] = row
+
+        if succeeded_chunks == 0 and first_error is not None:
+            raise first_error
+        return output
+
+    def _lookup_users_chunk(
+        self,
+        client: httpx.Client,
+        *,
+        access_token: str,
+        user_ids: list[str],
+    ) -> list[Any]:
+        try:
+            response = client.get(
+                self.users_lookup_url,
+                headers={"Authorization": f"Bearer {access_token}"},
+                params={"ids": ",".join(user_ids), "user.fields": "username,name,public_metrics"},
+            )
+        except httpx.HTTPError as exc:
+            raise XClientError("X users lookup request failed") from exc
+        if response.status_code >= 400:
+            raise XClientError(f"X users lookup failed with status {response.status_code}")
+        payload = self._safe_json(response, context="X users lookup")
+        rows = payload.get("data")
+        return rows if isinstance(rows, list) else []
+
     def get_user_recent_posts(
         self,
         *,
@@ -412,4 +479,5 @@ def get_x_client() -> XClient:
         redirect_uri=settings.x_redirect_uri,
         timeout_seconds=settings.x_api_timeout_seconds,
         default_open_calls_query=settings.x_default_open_calls_query,
+        users_lookup_url=settings.x_users_lookup_url,
     )
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from functools import lru_cache
-from typing import Generator, Optional, Tuple
+from typing import Any, Generator, Optional, Tuple
 
 from sqlalchemy import create_engine, text
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from src.core.config import get_settings
@@ -38,6 +39,17 @@ def get_session() -> Generator[Session, None, None]:
         session.close()
 
 
+def dialect_insert(session: Session, model: Any):
+    """Return an INSERT that supports ``on_conflict_do_update`` for the session's dialect."""
+
+    dialect_name = session.get_bind().dialect.name
+    if dialect_name == "postgresql":
+        return postgresql.insert(model)
+    if dialect_name == "sqlite":
+        return sqlite.insert(model)
+    raise ValueError(f"Upsert is not supported for dialect: {dialect_name}")
+
+
 def test_connection() -> Tuple[bool, Optional[str]]:
     try:
         with get_engine().connect() as connection:
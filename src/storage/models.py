@@ -3,10 +3,26 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import Optional
+from typing import Any, Optional
 import uuid
 
-from sqlalchemy import Boolean, Date, DateTime, Float, ForeignKey, Index, Integer, String, Text, UniqueConstraint, func
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Computed,
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.storage.db import Base
@@ -16,6 +32,10 @@ def _uuid() -> str:
     return str(uuid.uuid4())
 
 
+# Native JSON payloads: JSONB on Postgres, JSON-as-text elsewhere (SQLite tests).
+JSONPayload = JSON().with_variant(JSONB(), "postgresql")
+
+
 class Workspace(Base):
     __tablename__ = "workspaces"
 
@@ -85,6 +105,7 @@ class WorkspaceUser(Base):
     __table_args__ = (
         UniqueConstraint("workspace_id", "user_id", name="uq_workspace_users_workspace_user"),
         Index("ix_workspace_users_workspace_created_at", "workspace_id", "created_at"),
+        Index("ix_workspace_users_user_id", "user_id"),
     )
 
 
@@ -902,7 +923,13 @@ class XStrategyDiscoveryCandidate(Base):
 
     __table_args__ = (
         UniqueConstraint("workspace_id", "account_user_id", name="uq_x_strategy_discovery_workspace_account"),
-        Index("ix_x_strategy_discovery_workspace_status_score", "workspace_id", "status", "score"),
+        Index(
+            "ix_x_strategy_discovery_workspace_status_score_discovered_at",
+            "workspace_id",
+            "status",
+            "score",
+            "discovered_at",
+        ),
         Index("ix_x_strategy_discovery_workspace_discovered_at", "workspace_id", "discovered_at"),
     )
 
@@ -959,6 +986,12 @@ class XCompetitorPost(Base):
     reply_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     repost_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     quote_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Maintained by the database so scans can SUM() it without re-adding the counters.
+    engagement_total: Mapped[int] = mapped_column(
+        Integer,
+        Computed("like_count + reply_count + repost_count + quote_count", persisted=True),
+        nullable=False,
+    )
     impression_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     has_image: Mapped[Optional[bool]] = mapped_column(Boolean, nullable=True)
     raw_json: Mapped[str] = mapped_column(Text, nullable=False, default="{}")
@@ -991,6 +1024,7 @@ class XCompetitorPost(Base):
             "watched_account_user_id",
             "captured_at",
         ),
+        Index("ix_x_competitor_posts_workspace_captured_at", "workspace_id", "captured_at"),
     )
 
 
@@ -1004,13 +1038,14 @@ class XStrategyPattern(Base):
         nullable=False,
     )
     period_window: Mapped[str] = mapped_column(String(32), nullable=False)
-    pattern_json: Mapped[str] = mapped_column(Text, nullable=False, default="{}")
+    pattern_json: Mapped[dict[str, Any]] = mapped_column(JSONPayload, nullable=False, default=dict)
     confidence_score: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     generated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
         server_default=func.now(),
     )
+    generated_at_iso: Mapped[Optional[str]] = mapped_column(String(40), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -1018,7 +1053,12 @@ class XStrategyPattern(Base):
     )
 
     __table_args__ = (
-        Index("ix_x_strategy_patterns_workspace_generated_at", "workspace_id", "generated_at"),
+        Index(
+            "ix_x_strategy_patterns_workspace_generated_at_desc",
+            "workspace_id",
+            text("generated_at DESC"),
+            postgresql_include=["period_window", "confidence_score", "generated_at_iso"],
+        ),
     )
 
 
@@ -1032,7 +1072,7 @@ class XStrategyRecommendation(Base):
         nullable=False,
     )
     period_window: Mapped[str] = mapped_column(String(32), nullable=False)
-    recommendation_json: Mapped[str] = mapped_column(Text, nullable=False, default="{}")
+    recommendation_json: Mapped[dict[str, Any]] = mapped_column(JSONPayload, nullable=False, default=dict)
     rationale_json: Mapped[str] = mapped_column(Text, nullable=False, default="{}")
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -1041,5 +1081,10 @@ class XStrategyRecommendation(Base):
     )
 
     __table_args__ = (
-        Index("ix_x_strategy_recommendations_workspace_created_at", "workspace_id", "created_at"),
+        Index(
+            "ix_x_strategy_recommendations_workspace_created_at_desc",
+            "workspace_id",
+            text("created_at DESC"),
+            postgresql_include=["period_window"],
+        ),
     )
@@ -3,17 +3,27 @@
 from __future__ import annotations
 
 import base64
+from collections import OrderedDict
 from functools import lru_cache
 import hashlib
 import hmac
 import os
 import secrets
+import threading
 from typing import Tuple
 
 from src.core.config import get_settings
 
 
 PBKDF2_ROUNDS = 260_000
+PASSWORD_VERIFY_CACHE_SIZE = 1024
+
+# Successful verifications keyed by an HMAC of (encoded hash, password) under a
+# per-process random key, so neither plaintext nor an offline-crackable digest
+# is retained. A new hash (new salt) never matches an old entry.
+_password_verify_cache_key = secrets.token_bytes(32)
+_password_verify_cache: "OrderedDict[bytes, None]" = OrderedDict()
+_password_verify_cache_lock = threading.Lock()
 
 
 def hash_password(password: str) -> str:
@@ -43,6 +53,36 @@ def verify_password(password: str, encoded_hash: str) -> bool:
     return hmac.compare_digest(observed, expected)
 
 
+def verify_password_cached(password: str, encoded_hash: str) -> bool:
+    """Verify password, skipping PBKDF2 for a recently successful (hash, password) pair."""
+
+    cache_key = hmac.new(
+        _password_verify_cache_key,
+        f"{encoded_hash}\0{password}".encode("utf-8"),
+        hashlib.sha256,
+    ).digest()
+    with _password_verify_cache_lock:
+        if cache_key in _password_verify_cache:
+            _password_verify_cache.move_to_end(cache_key)
+            return True
+
+    # Only successes are cached: failed guesses always pay the full KDF cost, so
+    # timing does not reveal repeated guesses and they cannot evict real logins.
+    result = verify_password(password, encoded_hash)
+    if result:
+        with _password_verify_cache_lock:
+            _password_verify_cache[cache_key] = None
+            _password_verify_cache.move_to_end(cache_key)
+            while len(_password_verify_cache) > PASSWORD_VERIFY_CACHE_SIZE:
+                _password_verify_cache.popitem(last=False)
+    return result
+
+
+def reset_password_verify_cache() -> None:
+    with _password_verify_cache_lock:
+        _password_verify_cache.clear()
+
+
 def hash_api_key(api_key: str) -> str:
     return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
 
@@ -3,17 +3,23 @@
 from __future__ import annotations
 
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
 import json
+import re
 from typing import Any, Dict, Optional
 import uuid
 
-from sqlalchemy import desc, select
+from sqlalchemy import String, bindparam, case, desc, func, null, select, true, update
 from sqlalchemy.orm import Session
 
 from src.core.config import get_settings
 from src.integrations.x.service import get_workspace_x_access_token
 from src.integrations.x.x_client import XClient
+from src.storage.db import dialect_insert
 from src.storage.models import (
     WorkspaceEvent,
     XCompetitorPost,
@@ -23,9 +29,16 @@ from src.storage.models import (
     XStrategyWatchlist,
 )
 
+X_FETCH_MAX_WORKERS = 8
+PATTERN_TEXT_BATCH_SIZE = 1000
+_OPENER_TOKEN_RE = re.compile(r"\S+")
+# json.dumps builds a fresh JSONEncoder whenever non-default options are passed;
+# reuse one configured encoder for every rationale, event and raw post payload.
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=True, sort_keys=True)
+
 
 def _json_dumps(payload: Any) -> str:
-    return json.dumps(payload, separators=(",", ":"), ensure_ascii=True, sort_keys=True)
+    return _JSON_ENCODER.encode(payload)
 
 
 def _json_load(payload: str) -> Any:
@@ -36,6 +49,10 @@ def _json_load(payload: str) -> Any:
 
 
 def _as_int(value: Any) -> int:
+    # Exact-type check first: plain ints from X payloads skip the isinstance ladder
+    # (bool is a distinct class, so it still falls through to the zero branch).
+    if value.__class__ is int:
+        return value
     if isinstance(value, bool):
         return 0
     if isinstance(value, int):
@@ -52,6 +69,11 @@ def _as_int(value: Any) -> int:
 
 
 def _as_float(value: Any) -> float:
+    value_class = value.__class__
+    if value_class is float:
+        return value
+    if value_class is int:
+        return float(value)
     if isinstance(value, bool):
         return 0.0
     if isinstance(value, (int, float)):
@@ -83,26 +105,40 @@ def build_x_profile_url(*, account_user_id: str, account_username: Optional[str]
     return "https://x.com"
 
 
-def get_strategy_discovery_criteria(*, settings: Any | None = None) -> Dict[str, Any]:
+@dataclass(frozen=True, slots=True)
+class DiscoveryCriteria:
+    min_score: int
+    min_avg_engagement: float
+    min_engagement_rate_pct: float
+    min_cadence_per_day: float
+    min_signal_posts: int
+    min_recent_posts: int
+    min_followers: int
+    max_followers: int
+    require_followers_in_band: bool
+
+
+def get_strategy_discovery_criteria(*, settings: Any | None = None) -> DiscoveryCriteria:
+    # Built once per discovery run; not cached so patched settings are always honoured.
     active_settings = settings if settings is not None else get_settings()
     min_followers = max(0, _as_int(getattr(active_settings, "x_strategy_candidate_min_followers", 0)))
     max_followers = max(min_followers, _as_int(getattr(active_settings, "x_strategy_candidate_max_followers", 0)))
-    return {
-        "min_score": max(0, min(100, _as_int(getattr(active_settings, "x_strategy_candidate_min_score", 0)))),
-        "min_avg_engagement": max(0.0, _as_float(getattr(active_settings, "x_strategy_candidate_min_avg_engagement", 0.0))),
-        "min_engagement_rate_pct": max(
+    return DiscoveryCriteria(
+        min_score=max(0, min(100, _as_int(getattr(active_settings, "x_strategy_candidate_min_score", 0)))),
+        min_avg_engagement=max(0.0, _as_float(getattr(active_settings, "x_strategy_candidate_min_avg_engagement", 0.0))),
+        min_engagement_rate_pct=max(
             0.0,
             _as_float(getattr(active_settings, "x_strategy_candidate_min_engagement_rate_pct", 0.0)),
         ),
-        "min_cadence_per_day": max(0.0, _as_float(getattr(active_settings, "x_strategy_candidate_min_cadence_per_day", 0.0))),
-        "min_signal_posts": max(0, _as_int(getattr(active_settings, "x_strategy_candidate_min_signal_posts", 0))),
-        "min_recent_posts": max(1, _as_int(getattr(active_settings, "x_strategy_candidate_min_recent_posts", 1))),
-        "min_followers": min_followers,
-        "max_followers": max_followers,
-        "require_followers_in_band": bool(
+        min_cadence_per_day=max(0.0, _as_float(getattr(active_settings, "x_strategy_candidate_min_cadence_per_day", 0.0))),
+        min_signal_posts=max(0, _as_int(getattr(active_settings, "x_strategy_candidate_min_signal_posts", 0))),
+        min_recent_posts=max(1, _as_int(getattr(active_settings, "x_strategy_candidate_min_recent_posts", 1))),
+        min_followers=min_followers,
+        max_followers=max_followers,
+        require_followers_in_band=bool(
             getattr(active_settings, "x_strategy_candidate_require_followers_in_band", True)
         ),
-    }
+    )
 
 
 def parse_discovery_candidate_rationale(candidate: XStrategyDiscoveryCandidate) -> Dict[str, Any]:
@@ -153,35 +189,40 @@ def _calculate_recent_post_stats(posts: list[Dict[str, Any]]) -> Dict[str, Any]:
     if not posts:
         return {"avg_engagement": 0.0, "cadence_per_day": 0.0, "post_count": 0}
 
-    engagement_samples: list[float] = []
-    timestamps: list[datetime] = []
+    # Single pass with running accumulators; no per-user sample lists.
+    engagement_total = 0
+    timestamp_count = 0
+    min_dt: Optional[datetime] = None
+    max_dt: Optional[datetime] = None
     for payload in posts:
         metrics = payload.get("public_metrics")
         if not isinstance(metrics, dict):
             metrics = {}
-        engagement = float(
+        engagement_total += (
             _as_int(metrics.get("like_count"))
             + _as_int(metrics.get("reply_count"))
             + _as_int(metrics.get("retweet_count") or metrics.get("repost_count"))
             + _as_int(metrics.get("quote_count"))
         )
-        engagement_samples.append(engagement)
 
         created_at = payload.get("created_at")
         if isinstance(created_at, str) and created_at.strip():
             try:
-                timestamps.append(datetime.fromisoformat(created_at.replace("Z", "+00:00")))
+                parsed = _normalize_dt(datetime.fromisoformat(created_at))
             except ValueError:
                 continue
+            timestamp_count += 1
+            if min_dt is None or parsed < min_dt:
+                min_dt = parsed
+            if max_dt is None or parsed > max_dt:
+                max_dt = parsed
 
-    avg_engagement = round(sum(engagement_samples) / len(engagement_samples), 2) if engagement_samples else 0.0
+    avg_engagement = round(engagement_total / len(posts), 2)
     cadence_per_day = 0.0
-    if len(timestamps) >= 2:
-        min_dt = _normalize_dt(min(timestamps))
-        max_dt = _normalize_dt(max(timestamps))
+    if timestamp_count >= 2 and min_dt is not None and max_dt is not None:
         window_days = max((max_dt - min_dt).total_seconds() / 86400.0, 1.0)
-        cadence_per_day = round(len(timestamps) / window_days, 2)
-    elif len(timestamps) == 1:
+        cadence_per_day = round(timestamp_count / window_days, 2)
+    elif timestamp_count == 1:
         cadence_per_day = 1.0
 
     return {
@@ -198,37 +239,77 @@ def upsert_watchlist_account(
     account_user_id: str,
     account_username: Optional[str] = None,
     added_by_user_id: Optional[str] = None,
+    commit: bool = True,
 ) -> XStrategyWatchlist:
-    normalized_account_user_id = account_user_id.strip()
-    if not normalized_account_user_id:
-        raise ValueError("account_user_id_required")
-    normalized_username = account_username.strip() if isinstance(account_username, str) else None
-    if normalized_username == "":
-        normalized_username = None
-
-    row = session.scalar(
-        select(XStrategyWatchlist).where(
-            XStrategyWatchlist.workspace_id == workspace_id,
-            XStrategyWatchlist.account_user_id == normalized_account_user_id,
-        )
+    rows = upsert_watchlist_accounts(
+        session,
+        workspace_id=workspace_id,
+        accounts=[{"account_user_id": account_user_id, "account_username": account_username}],
+        added_by_user_id=added_by_user_id,
+        commit=commit,
     )
-    if row is None:
-        row = XStrategyWatchlist(
-            id=str(uuid.uuid4()),
-            workspace_id=workspace_id,
-            account_user_id=normalized_account_user_id,
-            account_username=normalized_username,
-            status="active",
-            added_by_user_id=added_by_user_id,
-        )
-        session.add(row)
-    else:
-        row.account_username = normalized_username or row.account_username
-        row.status = "active"
-        row.updated_at = datetime.now(timezone.utc)
+    return rows[0]
 
-    session.commit()
-    return row
+
+def upsert_watchlist_accounts(
+    session: Session,
+    *,
+    workspace_id: str,
+    accounts: list[Dict[str, Any]],
+    added_by_user_id: Optional[str] = None,
+    commit: bool = True,
+) -> list[XStrategyWatchlist]:
+    normalized_accounts: list[tuple[str, Optional[str]]] = []
+    for account in accounts:
+        raw_user_id = account.get("account_user_id")
+        normalized_account_user_id = raw_user_id.strip() if isinstance(raw_user_id, str) else ""
+        if not normalized_account_user_id:
+            raise ValueError("account_user_id_required")
+        raw_username = account.get("account_username")
+        normalized_username = raw_username.strip() if isinstance(raw_username, str) else None
+        if normalized_username == "":
+            normalized_username = None
+        normalized_accounts.append((normalized_account_user_id, normalized_username))
+
+    # One lookup for the whole batch and a single commit at the end.
+    existing_by_account: Dict[str, XStrategyWatchlist] = {}
+    if normalized_accounts:
+        existing_by_account = {
+            row.account_user_id: row
+            for row in session.scalars(
+                select(XStrategyWatchlist).where(
+                    XStrategyWatchlist.workspace_id == workspace_id,
+                    XStrategyWatchlist.account_user_id.in_(
+                        {account_user_id for account_user_id, _ in normalized_accounts}
+                    ),
+                )
+            )
+        }
+
+    now = datetime.now(timezone.utc)
+    rows: list[XStrategyWatchlist] = []
+    for normalized_account_user_id, normalized_username in normalized_accounts:
+        row = existing_by_account.get(normalized_account_user_id)
+        if row is None:
+            row = XStrategyWatchlist(
+                id=str(uuid.uuid4()),
+                workspace_id=workspace_id,
+                account_user_id=normalized_account_user_id,
+                account_username=normalized_username,
+                status="active",
+                added_by_user_id=added_by_user_id,
+            )
+            session.add(row)
+            existing_by_account[normalized_account_user_id] = row
+        else:
+            row.account_username = normalized_username or row.account_username
+            row.status = "active"
+            row.updated_at = now
+        rows.append(row)
+
+    if commit:
+        session.commit()
+    return rows
 
 
 def list_watchlist_accounts(session: Session, *, workspace_id: str, status: str = "active") -> list[XStrategyWatchlist]:
@@ -245,65 +326,51 @@ def list_watchlist_accounts(session: Session, *, workspace_id: str, status: str
     )
 
 
-def _upsert_discovery_candidate(
+def _bulk_upsert_discovery_candidates(
     session: Session,
     *,
     workspace_id: str,
-    account_user_id: str,
-    account_username: Optional[str],
-    source_query: str,
-    signal_post_count: int,
-    followers_count: Optional[int],
-    tweet_count: Optional[int],
-    avg_engagement: float,
-    cadence_per_day: float,
-    score: int,
-    rationale: Dict[str, Any],
-    status: str = "pending",
-) -> tuple[XStrategyDiscoveryCandidate, bool]:
-    normalized_status = (status or "pending").strip().lower() or "pending"
-    existing = session.scalar(
-        select(XStrategyDiscoveryCandidate).where(
-            XStrategyDiscoveryCandidate.workspace_id == workspace_id,
-            XStrategyDiscoveryCandidate.account_user_id == account_user_id,
-        )
+    rows: list[Dict[str, Any]],
+    now: datetime,
+) -> None:
+    """Insert or refresh discovery candidates with one INSERT ... ON CONFLICT statement."""
+
+    if not rows:
+        return
+    values = [
+        {
+            **row,
+            "workspace_id": workspace_id,
+            "status": "pending",
+            "discovered_at": now,
+            "updated_at": now,
+        }
+        for row in rows
+    ]
+    table = XStrategyDiscoveryCandidate.__table__
+    stmt = dialect_insert(session, XStrategyDiscoveryCandidate).values(values)
+    # Reviewed candidates keep their decision; everything else goes back to pending.
+    reviewed = table.c.status.in_(("approved", "rejected"))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["workspace_id", "account_user_id"],
+        set_={
+            "account_username": func.coalesce(stmt.excluded.account_username, table.c.account_username),
+            "source_query": stmt.excluded.source_query,
+            "signal_post_count": stmt.excluded.signal_post_count,
+            "followers_count": stmt.excluded.followers_count,
+            "tweet_count": stmt.excluded.tweet_count,
+            "avg_engagement": stmt.excluded.avg_engagement,
+            "cadence_per_day": stmt.excluded.cadence_per_day,
+            "score": stmt.excluded.score,
+            "rationale_json": stmt.excluded.rationale_json,
+            "status": case((reviewed, table.c.status), else_=stmt.excluded.status),
+            "reviewed_by_user_id": case((reviewed, table.c.reviewed_by_user_id), else_=null()),
+            "reviewed_at": case((reviewed, table.c.reviewed_at), else_=null()),
+            "discovered_at": stmt.excluded.discovered_at,
+            "updated_at": stmt.excluded.updated_at,
+        },
     )
-    if existing is None:
-        row = XStrategyDiscoveryCandidate(
-            id=str(uuid.uuid4()),
-            workspace_id=workspace_id,
-            account_user_id=account_user_id,
-            account_username=account_username,
-            source_query=source_query,
-            signal_post_count=signal_post_count,
-            followers_count=followers_count,
-            tweet_count=tweet_count,
-            avg_engagement=avg_engagement,
-            cadence_per_day=cadence_per_day,
-            score=score,
-            rationale_json=_json_dumps(rationale),
-            status=normalized_status,
-        )
-        session.add(row)
-        return row, True
-
-    existing.account_username = account_username or existing.account_username
-    existing.source_query = source_query
-    existing.signal_post_count = signal_post_count
-    existing.followers_count = followers_count
-    existing.tweet_count = tweet_count
-    existing.avg_engagement = avg_engagement
-    existing.cadence_per_day = cadence_per_day
-    existing.score = score
-    existing.rationale_json = _json_dumps(rationale)
-    if existing.status not in {"approved", "rejected"}:
-        existing.status = normalized_status
-        if normalized_status == "pending":
-            existing.reviewed_by_user_id = None
-            existing.reviewed_at = None
-    existing.discovered_at = datetime.now(timezone.utc)
-    existing.updated_at = datetime.now(timezone.utc)
-    return existing, False
+    session.execute(stmt)
 
 
 def list_pending_strategy_candidates(
@@ -328,6 +395,43 @@ def list_pending_strategy_candidates(
     )
 
 
+def _fetch_recent_posts_concurrently(
+    x_client: XClient,
+    *,
+    access_token: str,
+    user_ids: list[str],
+    max_results: int,
+) -> Dict[str, Optional[list[Dict[str, Any]]]]:
+    # Users whose fetch failed map to None so callers keep per-user error reporting.
+    def _fetch(user_id: str) -> tuple[str, Optional[list[Dict[str, Any]]]]:
+        try:
+            return user_id, x_client.get_user_recent_posts(
+                access_token=access_token,
+                user_id=user_id,
+                max_results=max_results,
+            )
+        except Exception:
+            return user_id, None
+
+    if not user_ids:
+        return {}
+    # X calls are blocking HTTP; threads overlap the latency. No DB access happens here.
+    with ThreadPoolExecutor(max_workers=min(X_FETCH_MAX_WORKERS, len(user_ids))) as executor:
+        return dict(executor.map(_fetch, user_ids))
+
+
+def count_pending_strategy_candidates(session: Session, *, workspace_id: str) -> int:
+    count = session.scalar(
+        select(func.count())
+        .select_from(XStrategyDiscoveryCandidate)
+        .where(
+            XStrategyDiscoveryCandidate.workspace_id == workspace_id,
+            XStrategyDiscoveryCandidate.status == "pending",
+        )
+    )
+    return int(count or 0)
+
+
 def run_workspace_strategy_discovery(
     session: Session,
     *,
@@ -340,7 +444,7 @@ def run_workspace_strategy_discovery(
         return {
             "workspace_id": workspace_id,
             "status": "missing_x_oauth",
-            "pending_count": len(list_pending_strategy_candidates(session, workspace_id=workspace_id, limit=100)),
+            "pending_count": count_pending_strategy_candidates(session, workspace_id=workspace_id),
             "discovered": 0,
             "updated": 0,
             "errors": ["x_oauth_missing_or_expired"],
@@ -350,15 +454,7 @@ def run_workspace_strategy_discovery(
     max_results = max(10, min(settings.x_strategy_discovery_max_results, 100))
     max_candidates = max(1, min(settings.x_strategy_discovery_max_candidates, 25))
     criteria = get_strategy_discovery_criteria(settings=settings)
-    min_followers = int(criteria["min_followers"])
-    max_followers = int(criteria["max_followers"])
-    min_score = int(criteria["min_score"])
-    min_avg_engagement = float(criteria["min_avg_engagement"])
-    min_engagement_rate_pct = float(criteria["min_engagement_rate_pct"])
-    min_cadence_per_day = float(criteria["min_cadence_per_day"])
-    min_signal_posts = int(criteria["min_signal_posts"])
-    min_recent_posts = int(criteria["min_recent_posts"])
-    require_followers_in_band = bool(criteria["require_followers_in_band"])
+    criteria_payload = asdict(criteria)
 
     try:
         payload = x_client.search_open_calls(
@@ -370,18 +466,24 @@ def run_workspace_strategy_discovery(
         return {
             "workspace_id": workspace_id,
             "status": "search_failed",
-            "pending_count": len(list_pending_strategy_candidates(session, workspace_id=workspace_id, limit=100)),
+            "pending_count": count_pending_strategy_candidates(session, workspace_id=workspace_id),
             "discovered": 0,
             "updated": 0,
             "errors": ["strategy_discovery_search_failed"],
         }
 
-    users_raw: list[Dict[str, Any]] = []
+    candidate_users: Any = None
     includes = payload.get("includes")
     if isinstance(includes, dict):
         candidate_users = includes.get("users")
-        if isinstance(candidate_users, list):
-            users_raw = [row for row in candidate_users if isinstance(row, dict)]
+    # One pass: keep dict rows with an id, last occurrence wins.
+    dedupe_users: Dict[str, Dict[str, Any]] = {}
+    if isinstance(candidate_users, list):
+        dedupe_users = {
+            user_id: row
+            for row in candidate_users
+            if isinstance(row, dict) and (user_id := str(row.get("id") or "").strip())
+        }
 
     signal_posts_by_author: Dict[str, int] = {}
     data_rows = payload.get("data")
@@ -399,7 +501,6 @@ def run_workspace_strategy_discovery(
 
     discovered = 0
     updated = 0
-    scanned_users = 0
     quality_rejected = 0
     pruned_pending = 0
     errors: list[str] = []
@@ -408,25 +509,35 @@ def run_workspace_strategy_discovery(
     evaluated_candidates: list[Dict[str, Any]] = []
     selected_candidates: list[Dict[str, Any]] = []
 
-    dedupe_users: Dict[str, Dict[str, Any]] = {}
-    for user in users_raw:
-        user_id = str(user.get("id") or "").strip()
-        if not user_id:
-            continue
-        dedupe_users[user_id] = user
-
-    for user_id, user_payload in dedupe_users.items():
-        if user_id in active_watchlist_ids:
-            continue
-        scanned_users += 1
-        username = str(user_payload.get("username") or "").strip() or None
-
+    scan_user_ids = [user_id for user_id in dedupe_users if user_id not in active_watchlist_ids]
+    scanned_users = len(scan_user_ids)
+    if criteria.min_signal_posts > 0:
+        # Signal counts come from the search payload, so users that cannot pass the
+        # signal check are skipped before spending X lookups on them. They are tallied
+        # under their own reason, outside quality_rejected and the per-check counts.
+        signal_ready_ids = [
+            user_id
+            for user_id in scan_user_ids
+            if signal_posts_by_author.get(user_id, 0) >= criteria.min_signal_posts
+        ]
+        low_signal_users = len(scan_user_ids) - len(signal_ready_ids)
+        if low_signal_users:
+            rejected_by_reason["prefilter_signal_post_count"] += low_signal_users
+        scan_user_ids = signal_ready_ids
+    metrics_by_user: Dict[str, Dict[str, Any]] = {}
+    if scan_user_ids:
         try:
-            metrics_payload = x_client.get_user_public_metrics(
+            metrics_by_user = x_client.get_users_public_metrics_batch(
                 access_token=token,
-                user_id=user_id,
+                user_ids=scan_user_ids,
             )
         except Exception:
+            metrics_by_user = {}
+
+    eligible_users: list[tuple[str, int, int]] = []
+    for user_id in scan_user_ids:
+        metrics_payload = metrics_by_user.get(user_id)
+        if metrics_payload is None:
             errors.append(f"user_metrics_failed:{user_id}")
             continue
 
@@ -435,19 +546,24 @@ def run_workspace_strategy_discovery(
             metrics = {}
         followers_count = _as_int(metrics.get("followers_count"))
         tweet_count = _as_int(metrics.get("tweet_count"))
-        if followers_count < min_followers:
+        if followers_count < criteria.min_followers:
             rejected_by_reason["min_followers"] += 1
             continue
+        eligible_users.append((user_id, followers_count, tweet_count))
 
-        try:
-            posts = x_client.get_user_recent_posts(
-                access_token=token,
-                user_id=user_id,
-                max_results=15,
-            )
-        except Exception:
+    posts_by_user = _fetch_recent_posts_concurrently(
+        x_client,
+        access_token=token,
+        user_ids=[user_id for user_id, _, _ in eligible_users],
+        max_results=15,
+    )
+
+    for user_id, followers_count, tweet_count in eligible_users:
+        posts = posts_by_user.get(user_id)
+        if posts is None:
             errors.append(f"user_posts_failed:{user_id}")
             continue
+        username = str(dedupe_users[user_id].get("username") or "").strip() or None
 
         post_stats = _calculate_recent_post_stats(posts)
         signal_post_count = signal_posts_by_author.get(user_id, 0)
@@ -460,36 +576,35 @@ def run_workspace_strategy_discovery(
             avg_engagement=avg_engagement,
             cadence_per_day=cadence_per_day,
             signal_posts=signal_post_count,
-            min_followers=min_followers,
-            max_followers=max_followers,
+            min_followers=criteria.min_followers,
+            max_followers=criteria.max_followers,
         )
         profile_url = build_x_profile_url(account_user_id=user_id, account_username=username)
 
         quality_checks: Dict[str, bool] = {
-            "score": score >= min_score,
-            "avg_engagement": avg_engagement >= min_avg_engagement,
-            "engagement_rate_pct": engagement_rate_pct >= min_engagement_rate_pct,
-            "cadence_per_day": cadence_per_day >= min_cadence_per_day,
-            "signal_post_count": signal_post_count >= min_signal_posts,
-            "recent_posts": post_count >= min_recent_posts,
+            "score": score >= criteria.min_score,
+            "avg_engagement": avg_engagement >= criteria.min_avg_engagement,
+            "engagement_rate_pct": engagement_rate_pct >= criteria.min_engagement_rate_pct,
+            "cadence_per_day": cadence_per_day >= criteria.min_cadence_per_day,
+            "signal_post_count": signal_post_count >= criteria.min_signal_posts,
+            "recent_posts": post_count >= criteria.min_recent_posts,
         }
-        if require_followers_in_band:
-            quality_checks["followers_in_band"] = followers_count <= max_followers
+        if criteria.require_followers_in_band:
+            quality_checks["followers_in_band"] = followers_count <= criteria.max_followers
         failed_checks = [name for name, passed in quality_checks.items() if not passed]
 
         rationale["signal_post_count"] = signal_post_count
         rationale["post_count"] = post_count
         rationale["engagement_rate_pct"] = engagement_rate_pct
         rationale["profile_url"] = profile_url
-        rationale["criteria"] = criteria
+        rationale["criteria"] = criteria_payload
         rationale["quality_checks"] = quality_checks
         rationale["failed_checks"] = failed_checks
         rationale["quality_passed"] = not failed_checks
 
         if failed_checks:
             quality_rejected += 1
-            for failed_reason in failed_checks:
-                rejected_by_reason[failed_reason] += 1
+            rejected_by_reason.update(failed_checks)
             continue
 
         rationale["selection_reason"] = (
@@ -526,68 +641,96 @@ def run_workspace_strategy_discovery(
     if dropped_by_rank > 0:
         rejected_by_reason["rank_cutoff"] += dropped_by_rank
 
+    # One prefetch for the shortlisted accounts instead of a SELECT per entry.
+    shortlisted_account_ids = [str(entry.get("account_user_id") or "") for entry in shortlisted]
+    existing_candidates: list[XStrategyDiscoveryCandidate] = []
+    if shortlisted_account_ids:
+        existing_candidates = list(
+            session.scalars(
+                select(XStrategyDiscoveryCandidate).where(
+                    XStrategyDiscoveryCandidate.workspace_id == workspace_id,
+                    XStrategyDiscoveryCandidate.account_user_id.in_(shortlisted_account_ids),
+                )
+            ).all()
+        )
+    existing_by_account = {row.account_user_id: row for row in existing_candidates}
+
     shortlisted_user_ids: set[str] = set()
+    upsert_rows: list[Dict[str, Any]] = []
     for entry in shortlisted:
-        row, created = _upsert_discovery_candidate(
-            session,
-            workspace_id=workspace_id,
-            account_user_id=str(entry.get("account_user_id") or ""),
-            account_username=entry.get("account_username"),
-            source_query=query,
-            signal_post_count=int(entry.get("signal_post_count") or 0),
-            followers_count=entry.get("followers_count"),
-            tweet_count=entry.get("tweet_count"),
-            avg_engagement=float(entry.get("avg_engagement") or 0.0),
-            cadence_per_day=float(entry.get("cadence_per_day") or 0.0),
-            score=int(entry.get("score") or 0),
-            rationale=dict(entry.get("rationale") or {}),
-            status="pending",
+        account_user_id = str(entry.get("account_user_id") or "")
+        existing = existing_by_account.get(account_user_id)
+        if existing is not None and existing.status in {"approved", "rejected"}:
+            # Still refresh the metrics; the upsert keeps the review decision.
+            candidate_id = existing.id
+        elif existing is not None:
+            candidate_id = existing.id
+            shortlisted_user_ids.add(account_user_id)
+            updated += 1
+        else:
+            candidate_id = str(uuid.uuid4())
+            shortlisted_user_ids.add(account_user_id)
+            discovered += 1
+        upsert_rows.append(
+            {
+                "id": candidate_id,
+                "account_user_id": account_user_id,
+                "account_username": entry.get("account_username"),
+                "source_query": query,
+                "signal_post_count": int(entry.get("signal_post_count") or 0),
+                "followers_count": entry.get("followers_count"),
+                "tweet_count": entry.get("tweet_count"),
+                "avg_engagement": float(entry.get("avg_engagement") or 0.0),
+                "cadence_per_day": float(entry.get("cadence_per_day") or 0.0),
+                "score": int(entry.get("score") or 0),
+                "rationale_json": _json_dumps(dict(entry.get("rationale") or {})),
+            }
         )
-        if row.status != "pending":
+        if account_user_id not in shortlisted_user_ids:
             continue
-        shortlisted_user_ids.add(row.account_user_id)
-        if created:
-            discovered += 1
-        else:
-            updated += 1
+        account_username = entry.get("account_username") or (existing.account_username if existing else None)
+        # The evaluation pass already built the URL unless the username comes from the stored row.
+        profile_url = entry.get("profile_url")
+        if not profile_url or account_username != entry.get("account_username"):
+            profile_url = build_x_profile_url(account_user_id=account_user_id, account_username=account_username)
         selected_candidates.append(
             {
-                "candidate_id": row.id,
-                "account_user_id": row.account_user_id,
-                "account_username": row.account_username,
-                "profile_url": build_x_profile_url(
-                    account_user_id=row.account_user_id,
-                    account_username=row.account_username,
-                ),
-                "score": row.score,
-                "followers_count": row.followers_count,
-                "signal_post_count": row.signal_post_count,
-                "avg_engagement": float(row.avg_engagement or 0.0),
-                "cadence_per_day": float(row.cadence_per_day or 0.0),
+                "candidate_id": candidate_id,
+                "account_user_id": account_user_id,
+                "account_username": account_username,
+                "profile_url": profile_url,
+                "score": int(entry.get("score") or 0),
+                "followers_count": entry.get("followers_count"),
+                "signal_post_count": int(entry.get("signal_post_count") or 0),
+                "avg_engagement": float(entry.get("avg_engagement") or 0.0),
+                "cadence_per_day": float(entry.get("cadence_per_day") or 0.0),
                 "engagement_rate_pct": float(entry.get("engagement_rate_pct") or 0.0),
                 "selection_reason": str((entry.get("rationale") or {}).get("selection_reason") or ""),
             }
         )
 
-    pending_rows = list(
-        session.scalars(
-            select(XStrategyDiscoveryCandidate).where(
-                XStrategyDiscoveryCandidate.workspace_id == workspace_id,
-                XStrategyDiscoveryCandidate.status == "pending",
-            )
-        ).all()
-    )
     now = datetime.now(timezone.utc)
-    for row in pending_rows:
-        if row.account_user_id in shortlisted_user_ids:
-            continue
-        row.status = "rejected_auto"
-        row.updated_at = now
-        pruned_pending += 1
+    _bulk_upsert_discovery_candidates(session, workspace_id=workspace_id, rows=upsert_rows, now=now)
+    # The Core upsert bypasses the identity map; drop stale state for the touched rows.
+    for row in existing_candidates:
+        session.expire(row)
+
+    # Pending candidates that fell out of the shortlist are retired with one UPDATE.
+    prune_result = session.execute(
+        update(XStrategyDiscoveryCandidate)
+        .where(
+            XStrategyDiscoveryCandidate.workspace_id == workspace_id,
+            XStrategyDiscoveryCandidate.status == "pending",
+            XStrategyDiscoveryCandidate.account_user_id.not_in(shortlisted_user_ids),
+        )
+        .values(status="rejected_auto", updated_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    pruned_pending = int(prune_result.rowcount or 0)
 
     ranked_ids = [entry["candidate_id"] for entry in selected_candidates]
     session.flush()
-    pending_count = len(list_pending_strategy_candidates(session, workspace_id=workspace_id, limit=200))
+    pending_count = count_pending_strategy_candidates(session, workspace_id=workspace_id)
 
     session.add(
         WorkspaceEvent(
@@ -604,7 +747,7 @@ def run_workspace_strategy_discovery(
                     "pruned_pending": pruned_pending,
                     "rejected_by_reason": dict(rejected_by_reason),
                     "pending_count": pending_count,
-                    "criteria": criteria,
+                    "criteria": criteria_payload,
                     "candidate_ids": ranked_ids,
                     "errors": errors,
                 }
@@ -623,7 +766,7 @@ def run_workspace_strategy_discovery(
         "quality_rejected": quality_rejected,
         "pruned_pending": pruned_pending,
         "rejected_by_reason": dict(rejected_by_reason),
-        "criteria": criteria,
+        "criteria": criteria_payload,
         "pending_count": pending_count,
         "candidates": selected_candidates,
         "errors": errors,
@@ -637,13 +780,8 @@ def approve_strategy_candidate(
     candidate_id: str,
     reviewed_by_user_id: str,
 ) -> Optional[Dict[str, Any]]:
-    row = session.scalar(
-        select(XStrategyDiscoveryCandidate).where(
-            XStrategyDiscoveryCandidate.workspace_id == workspace_id,
-            XStrategyDiscoveryCandidate.id == candidate_id,
-        )
-    )
-    if row is None:
+    row = session.get(XStrategyDiscoveryCandidate, candidate_id)
+    if row is None or row.workspace_id != workspace_id:
         return None
 
     watchlist_row = upsert_watchlist_account(
@@ -652,11 +790,14 @@ def approve_strategy_candidate(
         account_user_id=row.account_user_id,
         account_username=row.account_username,
         added_by_user_id=reviewed_by_user_id,
+        commit=False,
     )
+    # Watchlist upsert, candidate review and event land in a single commit.
     row.status = "approved"
     row.reviewed_by_user_id = reviewed_by_user_id
-    row.reviewed_at = datetime.now(timezone.utc)
-    row.updated_at = datetime.now(timezone.utc)
+    now = datetime.now(timezone.utc)
+    row.reviewed_at = now
+    row.updated_at = now
     session.add(
         WorkspaceEvent(
             workspace_id=workspace_id,
@@ -688,19 +829,15 @@ def reject_strategy_candidate(
     candidate_id: str,
     reviewed_by_user_id: str,
 ) -> Optional[Dict[str, Any]]:
-    row = session.scalar(
-        select(XStrategyDiscoveryCandidate).where(
-            XStrategyDiscoveryCandidate.workspace_id == workspace_id,
-            XStrategyDiscoveryCandidate.id == candidate_id,
-        )
-    )
-    if row is None:
+    row = session.get(XStrategyDiscoveryCandidate, candidate_id)
+    if row is None or row.workspace_id != workspace_id:
         return None
 
     row.status = "rejected"
     row.reviewed_by_user_id = reviewed_by_user_id
-    row.reviewed_at = datetime.now(timezone.utc)
-    row.updated_at = datetime.now(timezone.utc)
+    now = datetime.now(timezone.utc)
+    row.reviewed_at = now
+    row.updated_at = now
     session.add(
         WorkspaceEvent(
             workspace_id=workspace_id,
@@ -723,18 +860,11 @@ def reject_strategy_candidate(
     }
 
 
-def _upsert_competitor_post(
-    session: Session,
-    *,
-    workspace_id: str,
-    watched_account_user_id: str,
-    watched_account_username: Optional[str],
-    payload: Dict[str, Any],
-) -> bool:
+def _competitor_post_values(payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     post_id = str(payload.get("id") or "").strip()
     text = str(payload.get("text") or "").strip()
     if not post_id or not text:
-        return False
+        return None
 
     metrics = payload.get("public_metrics")
     if not isinstance(metrics, dict):
@@ -744,76 +874,144 @@ def _upsert_competitor_post(
     normalized_post_created_at = None
     if isinstance(post_created_at, str) and post_created_at.strip():
         try:
-            normalized_post_created_at = datetime.fromisoformat(post_created_at.replace("Z", "+00:00"))
+            normalized_post_created_at = datetime.fromisoformat(post_created_at)
         except ValueError:
             normalized_post_created_at = None
 
-    existing = session.scalar(
-        select(XCompetitorPost).where(
-            XCompetitorPost.workspace_id == workspace_id,
-            XCompetitorPost.watched_account_user_id == watched_account_user_id,
-            XCompetitorPost.external_post_id == post_id,
-        )
+    return {
+        "external_post_id": post_id,
+        "text": text,
+        "post_created_at": normalized_post_created_at,
+        "like_count": _as_int(metrics.get("like_count")),
+        "reply_count": _as_int(metrics.get("reply_count")),
+        "repost_count": _as_int(metrics.get("retweet_count") or metrics.get("repost_count")),
+        "quote_count": _as_int(metrics.get("quote_count")),
+        "impression_count": _as_int(metrics.get("impression_count")) or None,
+        "has_image": bool(payload.get("has_image")),
+        "raw_json": _json_dumps(payload.get("raw") if isinstance(payload.get("raw"), dict) else payload),
+    }
+
+
+def _upsert_competitor_posts(
+    session: Session,
+    *,
+    workspace_id: str,
+    watched_account_user_id: str,
+    watched_account_username: Optional[str],
+    payloads: list[Dict[str, Any]],
+    now: Optional[datetime] = None,
+) -> int:
+    """Insert or refresh one account's posts with a single INSERT ... ON CONFLICT; returns valid posts seen."""
+
+    now = now or datetime.now(timezone.utc)
+    valid_posts = 0
+    values_by_post_id: Dict[str, Dict[str, Any]] = {}
+    for payload in payloads:
+        values = _competitor_post_values(payload)
+        if values is None:
+            continue
+        valid_posts += 1
+        # ON CONFLICT cannot touch the same row twice in one statement; last payload wins.
+        values_by_post_id[values["external_post_id"]] = {
+            **values,
+            "id": str(uuid.uuid4()),
+            "workspace_id": workspace_id,
+            "watched_account_user_id": watched_account_user_id,
+            "watched_account_username": watched_account_username,
+            "captured_at": now,
+            "updated_at": now,
+        }
+    if not values_by_post_id:
+        return 0
+
+    table = XCompetitorPost.__table__
+    stmt = dialect_insert(session, XCompetitorPost).values(list(values_by_post_id.values()))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["workspace_id", "watched_account_user_id", "external_post_id"],
+        set_={
+            "text": stmt.excluded.text,
+            "watched_account_username": func.coalesce(
+                stmt.excluded.watched_account_username,
+                table.c.watched_account_username,
+            ),
+            "post_created_at": stmt.excluded.post_created_at,
+            "like_count": stmt.excluded.like_count,
+            "reply_count": stmt.excluded.reply_count,
+            "repost_count": stmt.excluded.repost_count,
+            "quote_count": stmt.excluded.quote_count,
+            "impression_count": stmt.excluded.impression_count,
+            "has_image": stmt.excluded.has_image,
+            # raw_json is kept from the first capture: nothing reads it back, so
+            # rewriting the full payload on every rescan only adds write volume.
+            "captured_at": stmt.excluded.captured_at,
+            "updated_at": stmt.excluded.updated_at,
+        },
     )
-    if existing is None:
-        existing = XCompetitorPost(
-            id=str(uuid.uuid4()),
-            workspace_id=workspace_id,
-            watched_account_user_id=watched_account_user_id,
-            watched_account_username=watched_account_username,
-            external_post_id=post_id,
-            text=text,
-            post_created_at=normalized_post_created_at,
-            like_count=_as_int(metrics.get("like_count")),
-            reply_count=_as_int(metrics.get("reply_count")),
-            repost_count=_as_int(metrics.get("retweet_count") or metrics.get("repost_count")),
-            quote_count=_as_int(metrics.get("quote_count")),
-            impression_count=_as_int(metrics.get("impression_count")) or None,
-            has_image=bool(payload.get("has_image")),
-            raw_json=_json_dumps(payload.get("raw") if isinstance(payload.get("raw"), dict) else payload),
-        )
-        session.add(existing)
-    else:
-        existing.text = text
-        existing.watched_account_username = watched_account_username or existing.watched_account_username
-        existing.post_created_at = normalized_post_created_at
-        existing.like_count = _as_int(metrics.get("like_count"))
-        existing.reply_count = _as_int(metrics.get("reply_count"))
-        existing.repost_count = _as_int(metrics.get("retweet_count") or metrics.get("repost_count"))
-        existing.quote_count = _as_int(metrics.get("quote_count"))
-        existing.impression_count = _as_int(metrics.get("impression_count")) or None
-        existing.has_image = bool(payload.get("has_image"))
-        existing.raw_json = _json_dumps(payload.get("raw") if isinstance(payload.get("raw"), dict) else payload)
-        existing.captured_at = datetime.now(timezone.utc)
-        existing.updated_at = datetime.now(timezone.utc)
-    return True
-
-
-def _compute_pattern(rows: list[XCompetitorPost], *, window_days: int) -> Dict[str, Any]:
-    total_posts = len(rows)
-    posts_per_day = round(total_posts / max(1, window_days), 2)
-    avg_text_length = round(sum(len(row.text) for row in rows) / total_posts, 2) if rows else 0.0
+    session.execute(stmt)
+    return valid_posts
 
-    image_rows = [row for row in rows if row.has_image is not None]
-    image_rate = 0.0
-    if image_rows:
-        image_rate = round(sum(1 for row in image_rows if row.has_image) / len(image_rows), 2)
 
-    engagement_values = [row.like_count + row.reply_count + row.repost_count + row.quote_count for row in rows]
-    avg_engagement = round(sum(engagement_values) / total_posts, 2) if total_posts else 0.0
+def _post_opener(text: str) -> str:
+    # Only the first four tokens are scanned; the rest of the post is never copied.
+    return " ".join(match.group() for match in islice(_OPENER_TOKEN_RE.finditer(text), 4)).lower()
 
-    openers = Counter()
-    hour_counter = Counter()
-    for row in rows:
-        opener = " ".join(row.text.lower().split()[:4]).strip()
-        if opener:
-            openers[opener] += 1
-        if row.post_created_at is not None:
-            hour_counter[_normalize_dt(row.post_created_at).hour] += 1
 
+def _compute_pattern(
+    session: Session,
+    *,
+    workspace_id: str,
+    window_start: datetime,
+    window_days: int,
+) -> Dict[str, Any]:
+    window_filter = (
+        XCompetitorPost.workspace_id == workspace_id,
+        XCompetitorPost.captured_at >= window_start,
+    )
+    # Totals are aggregated in the database; no post rows are hydrated for them.
+    totals = session.execute(
+        select(
+            func.count(),
+            func.coalesce(func.sum(func.length(XCompetitorPost.text)), 0),
+            func.coalesce(func.sum(XCompetitorPost.engagement_total), 0),
+            func.count(XCompetitorPost.has_image),
+            func.coalesce(func.sum(case((XCompetitorPost.has_image.is_(True), 1), else_=0)), 0),
+            func.count(func.distinct(XCompetitorPost.watched_account_user_id)),
+        ).where(*window_filter)
+    ).one()
+    total_posts, text_length_total, engagement_total, image_known, image_count, account_count = (
+        int(value or 0) for value in totals
+    )
+
+    post_created_at = XCompetitorPost.post_created_at
+    if session.get_bind().dialect.name == "postgresql":
+        # EXTRACT on timestamptz follows the session TimeZone; pin it so hours are UTC.
+        post_created_at = func.timezone("UTC", post_created_at)
+    post_hour = func.extract("hour", post_created_at)
+    best_hours_utc = [
+        int(hour)
+        for hour in session.scalars(
+            select(post_hour)
+            .where(*window_filter, XCompetitorPost.post_created_at.is_not(None))
+            .group_by(post_hour)
+            .order_by(func.count().desc(), post_hour)
+            .limit(3)
+        ).all()
+    ]
+
+    # Openers are the only part that needs the text; load just that column and
+    # stream it straight into the Counter without an intermediate list.
+    texts = session.scalars(
+        select(XCompetitorPost.text)
+        .where(*window_filter)
+        .execution_options(yield_per=PATTERN_TEXT_BATCH_SIZE)
+    )
+    openers = Counter(opener for opener in map(_post_opener, texts) if opener)
     top_openers = [entry for entry, _ in openers.most_common(5)]
-    best_hours_utc = [hour for hour, _ in hour_counter.most_common(3)]
-    account_count = len({row.watched_account_user_id for row in rows})
+
+    posts_per_day = round(total_posts / max(1, window_days), 2)
+    avg_text_length = round(text_length_total / total_posts, 2) if total_posts else 0.0
+    image_rate = round(image_count / image_known, 2) if image_known else 0.0
+    avg_engagement = round(engagement_total / total_posts, 2) if total_posts else 0.0
 
     return {
         "window_days": window_days,
@@ -828,32 +1026,32 @@ def _compute_pattern(rows: list[XCompetitorPost], *, window_days: int) -> Dict[s
     }
 
 
+# (met, not met) copy for each threshold-driven recommendation.
+_CADENCE_RECOMMENDATIONS = (
+    "Manter cadencia proxima de 1 post/dia no X para consistencia de alcance.",
+    "Aumentar cadencia de publicacao para reduzir janelas sem distribuicao.",
+)
+_IMAGE_RECOMMENDATIONS = (
+    "Incluir mais posts com imagem para capturar padrao de contas com maior tracao.",
+    "Priorizar copy clara e curta; testar imagem apenas em posts de maior potencial.",
+)
+_ENGAGEMENT_RECOMMENDATIONS = (
+    "Reforcar estrategia de CTA para resposta, aproveitando bom baseline de engajamento.",
+    "Ajustar hooks de abertura e iterar temas com mais dor explicita de founders.",
+)
+
+
 def _build_recommendations(pattern: Dict[str, Any]) -> list[str]:
-    recommendations: list[str] = []
-    posts_per_day = float(pattern.get("posts_per_day") or 0.0)
-    image_rate = float(pattern.get("image_rate") or 0.0)
-    avg_engagement = float(pattern.get("avg_engagement") or 0.0)
-    top_openers = pattern.get("top_openers") if isinstance(pattern.get("top_openers"), list) else []
-    best_hours = pattern.get("best_hours_utc") if isinstance(pattern.get("best_hours_utc"), list) else []
-
-    if posts_per_day >= 1.0:
-        recommendations.append("Manter cadencia proxima de 1 post/dia no X para consistencia de alcance.")
-    else:
-        recommendations.append("Aumentar cadencia de publicacao para reduzir janelas sem distribuicao.")
-
-    if image_rate >= 0.4:
-        recommendations.append("Incluir mais posts com imagem para capturar padrao de contas com maior tracao.")
-    else:
-        recommendations.append("Priorizar copy clara e curta; testar imagem apenas em posts de maior potencial.")
-
-    if avg_engagement >= 10:
-        recommendations.append("Reforcar estrategia de CTA para resposta, aproveitando bom baseline de engajamento.")
-    else:
-        recommendations.append("Ajustar hooks de abertura e iterar temas com mais dor explicita de founders.")
-
-    if top_openers:
+    top_openers = pattern.get("top_openers")
+    best_hours = pattern.get("best_hours_utc")
+    recommendations = [
+        _CADENCE_RECOMMENDATIONS[0 if float(pattern.get("posts_per_day") or 0.0) >= 1.0 else 1],
+        _IMAGE_RECOMMENDATIONS[0 if float(pattern.get("image_rate") or 0.0) >= 0.4 else 1],
+        _ENGAGEMENT_RECOMMENDATIONS[0 if float(pattern.get("avg_engagement") or 0.0) >= 10 else 1],
+    ]
+    if top_openers and isinstance(top_openers, list):
         recommendations.append(f"Testar abertura inspirada em: '{top_openers[0]}'.")
-    if best_hours:
+    if best_hours and isinstance(best_hours, list):
         recommendations.append(f"Priorizar janela UTC: {', '.join(str(value) for value in best_hours)}.")
 
     return recommendations
@@ -887,80 +1085,75 @@ def run_workspace_strategy_scan(
             "errors": [],
         }
 
+    watchlist_count = len(watchlist)
+    now = datetime.now(timezone.utc)
     ingested_posts = 0
     errors: list[str] = []
+    # Timelines are fetched in parallel; the upserts stay on this thread's session.
+    posts_by_user = _fetch_recent_posts_concurrently(
+        x_client,
+        access_token=token,
+        user_ids=[account.account_user_id for account in watchlist],
+        max_results=max_posts_per_account,
+    )
     for account in watchlist:
-        try:
-            posts = x_client.get_user_recent_posts(
-                access_token=token,
-                user_id=account.account_user_id,
-                max_results=max_posts_per_account,
-            )
-        except Exception:
+        posts = posts_by_user.get(account.account_user_id)
+        if posts is None:
             errors.append(f"user_scan_failed:{account.account_user_id}")
             continue
 
-        for payload in posts:
-            created = _upsert_competitor_post(
-                session,
-                workspace_id=workspace_id,
-                watched_account_user_id=account.account_user_id,
-                watched_account_username=account.account_username,
-                payload=payload,
-            )
-            if created:
-                ingested_posts += 1
+        ingested_posts += _upsert_competitor_posts(
+            session,
+            workspace_id=workspace_id,
+            watched_account_user_id=account.account_user_id,
+            watched_account_username=account.account_username,
+            payloads=list(posts or []),
+            now=now,
+        )
 
-    window_start = datetime.now(timezone.utc) - timedelta(days=max(1, window_days))
-    rows = list(
-        session.scalars(
-            select(XCompetitorPost).where(
-                XCompetitorPost.workspace_id == workspace_id,
-                XCompetitorPost.captured_at >= window_start,
-            )
-        ).all()
+    window_start = now - timedelta(days=max(1, window_days))
+    pattern_payload = _compute_pattern(
+        session,
+        workspace_id=workspace_id,
+        window_start=window_start,
+        window_days=window_days,
     )
 
-    if not rows:
+    if not pattern_payload["total_posts"]:
+        no_data_payload = {
+            "status": "no_data",
+            "watchlist_count": watchlist_count,
+            "ingested_posts": ingested_posts,
+            "errors": errors,
+        }
         session.add(
             WorkspaceEvent(
                 workspace_id=workspace_id,
                 event_type="x_strategy_scan_completed",
-                payload_json=_json_dumps(
-                    {
-                        "status": "no_data",
-                        "watchlist_count": len(watchlist),
-                        "ingested_posts": ingested_posts,
-                        "errors": errors,
-                    }
-                ),
+                payload_json=_json_dumps(no_data_payload),
             )
         )
         session.commit()
-        return {
-            "workspace_id": workspace_id,
-            "status": "no_data",
-            "watchlist_count": len(watchlist),
-            "ingested_posts": ingested_posts,
-            "errors": errors,
-        }
+        return {"workspace_id": workspace_id, **no_data_payload}
 
-    pattern_payload = _compute_pattern(rows, window_days=window_days)
     recommendations = _build_recommendations(pattern_payload)
     confidence_score = min(100, int(pattern_payload.get("total_posts", 0) * 3))
 
+    generated_at = datetime.now(timezone.utc)
     pattern_row = XStrategyPattern(
         id=str(uuid.uuid4()),
         workspace_id=workspace_id,
         period_window=f"{window_days}d",
-        pattern_json=_json_dumps(pattern_payload),
+        pattern_json=pattern_payload,
         confidence_score=confidence_score,
+        generated_at=generated_at,
+        generated_at_iso=generated_at.isoformat(),
     )
     recommendations_row = XStrategyRecommendation(
         id=str(uuid.uuid4()),
         workspace_id=workspace_id,
         period_window=f"{window_days}d",
-        recommendation_json=_json_dumps({"items": recommendations}),
+        recommendation_json={"items": recommendations},
         rationale_json=_json_dumps(
             {
                 "total_posts": pattern_payload.get("total_posts"),
@@ -978,7 +1171,7 @@ def run_workspace_strategy_scan(
             payload_json=_json_dumps(
                 {
                     "status": "scanned",
-                    "watchlist_count": len(watchlist),
+                    "watchlist_count": watchlist_count,
                     "ingested_posts": ingested_posts,
                     "pattern_id": pattern_row.id,
                     "recommendation_id": recommendations_row.id,
@@ -992,7 +1185,7 @@ def run_workspace_strategy_scan(
     return {
         "workspace_id": workspace_id,
         "status": "scanned",
-        "watchlist_count": len(watchlist),
+        "watchlist_count": watchlist_count,
         "ingested_posts": ingested_posts,
         "pattern": pattern_payload,
         "recommendations": recommendations,
@@ -1001,41 +1194,182 @@ def run_workspace_strategy_scan(
     }
 
 
-def latest_workspace_strategy_report(session: Session, *, workspace_id: str) -> Dict[str, Any]:
-    pattern_row = session.scalar(
-        select(XStrategyPattern)
+@lru_cache(maxsize=1)
+def _latest_strategy_snapshot_stmt():
+    # Built once with a bound workspace_id; each report only binds the parameter,
+    # skipping the CTE construction and cache-key generation per request.
+    workspace_id = bindparam("workspace_id", type_=String())
+    watchlist_cte = (
+        select(func.count().label("watchlist_count"))
+        .select_from(XStrategyWatchlist)
+        .where(
+            XStrategyWatchlist.workspace_id == workspace_id,
+            XStrategyWatchlist.status == "active",
+        )
+        .cte("active_watchlist")
+    )
+    pattern_cte = (
+        select(
+            XStrategyPattern.id,
+            XStrategyPattern.period_window,
+            XStrategyPattern.pattern_json,
+            XStrategyPattern.confidence_score,
+            XStrategyPattern.generated_at,
+            XStrategyPattern.generated_at_iso,
+        )
         .where(XStrategyPattern.workspace_id == workspace_id)
         .order_by(XStrategyPattern.generated_at.desc())
         .limit(1)
+        .cte("latest_pattern")
     )
-    recommendation_row = session.scalar(
-        select(XStrategyRecommendation)
+    recommendation_cte = (
+        select(
+            XStrategyRecommendation.id,
+            XStrategyRecommendation.period_window,
+            XStrategyRecommendation.recommendation_json["items"].label("recommendation_items"),
+        )
         .where(XStrategyRecommendation.workspace_id == workspace_id)
         .order_by(XStrategyRecommendation.created_at.desc())
         .limit(1)
+        .cte("latest_recommendation")
     )
-    watchlist_count = len(list_watchlist_accounts(session, workspace_id=workspace_id, status="active"))
+    # The count CTE always yields exactly one row, so outer-joining the two
+    # "latest" CTEs onto it returns the whole snapshot in a single round trip.
+    return (
+        select(
+            watchlist_cte.c.watchlist_count,
+            pattern_cte.c.id.label("pattern_id"),
+            pattern_cte.c.period_window.label("pattern_period_window"),
+            pattern_cte.c.pattern_json,
+            pattern_cte.c.confidence_score,
+            pattern_cte.c.generated_at,
+            pattern_cte.c.generated_at_iso,
+            recommendation_cte.c.id.label("recommendation_id"),
+            recommendation_cte.c.period_window.label("recommendation_period_window"),
+            recommendation_cte.c.recommendation_items,
+        )
+        .select_from(watchlist_cte)
+        .outerjoin(pattern_cte, true())
+        .outerjoin(recommendation_cte, true())
+    )
+
+
+def _pattern_generated_at_iso(pattern: Any) -> str:
+    # Rows written before generated_at_iso existed fall back to formatting in Python.
+    return pattern.generated_at_iso or _normalize_dt(pattern.generated_at).isoformat()
 
-    if pattern_row is None and recommendation_row is None:
+
+def _build_strategy_report(
+    *,
+    workspace_id: str,
+    watchlist_count: int,
+    pattern: Any | None,
+    recommendation: Any | None,
+) -> Dict[str, Any]:
+    if pattern is None and recommendation is None:
         return {
             "workspace_id": workspace_id,
             "available": False,
             "watchlist_count": watchlist_count,
         }
 
-    recommendation_payload = {}
-    if recommendation_row is not None:
-        loaded = _json_load(recommendation_row.recommendation_json)
-        if isinstance(loaded, dict):
-            recommendation_payload = loaded
+    recommendation_items = recommendation.recommendation_items if recommendation is not None else None
+    if not isinstance(recommendation_items, list):
+        recommendation_items = []
 
     return {
         "workspace_id": workspace_id,
         "available": True,
         "watchlist_count": watchlist_count,
-        "period_window": pattern_row.period_window if pattern_row is not None else recommendation_row.period_window,
-        "pattern": _json_load(pattern_row.pattern_json) if pattern_row is not None else {},
-        "confidence_score": pattern_row.confidence_score if pattern_row is not None else 0,
-        "recommendations": recommendation_payload.get("items", []),
-        "generated_at": _normalize_dt(pattern_row.generated_at).isoformat() if pattern_row is not None else None,
+        "period_window": pattern.pattern_period_window if pattern is not None else recommendation.recommendation_period_window,
+        "pattern": (pattern.pattern_json or {}) if pattern is not None else {},
+        "confidence_score": pattern.confidence_score if pattern is not None else 0,
+        "recommendations": recommendation_items,
+        "generated_at": _pattern_generated_at_iso(pattern) if pattern is not None else None,
+    }
+
+
+def latest_workspace_strategy_report(session: Session, *, workspace_id: str) -> Dict[str, Any]:
+    snapshot = session.execute(_latest_strategy_snapshot_stmt(), {"workspace_id": workspace_id}).one()
+    return _build_strategy_report(
+        workspace_id=workspace_id,
+        watchlist_count=int(snapshot.watchlist_count or 0),
+        pattern=snapshot if snapshot.pattern_id is not None else None,
+        recommendation=snapshot if snapshot.recommendation_id is not None else None,
+    )
+
+
+def latest_workspace_strategy_reports(
+    session: Session,
+    *,
+    workspace_ids: list[str],
+) -> Dict[str, Dict[str, Any]]:
+    unique_ids = list(dict.fromkeys(workspace_ids))
+    if not unique_ids:
+        return {}
+
+    # row_number() keeps the "latest per workspace" lookup portable across
+    # Postgres and SQLite (DISTINCT ON is Postgres-only).
+    pattern_ranked = (
+        select(
+            XStrategyPattern.workspace_id,
+            XStrategyPattern.period_window.label("pattern_period_window"),
+            XStrategyPattern.pattern_json,
+            XStrategyPattern.confidence_score,
+            XStrategyPattern.generated_at,
+            XStrategyPattern.generated_at_iso,
+            func.row_number()
+            .over(
+                partition_by=XStrategyPattern.workspace_id,
+                order_by=XStrategyPattern.generated_at.desc(),
+            )
+            .label("position"),
+        )
+        .where(XStrategyPattern.workspace_id.in_(unique_ids))
+        .subquery("ranked_patterns")
+    )
+    recommendation_ranked = (
+        select(
+            XStrategyRecommendation.workspace_id,
+            XStrategyRecommendation.period_window.label("recommendation_period_window"),
+            XStrategyRecommendation.recommendation_json["items"].label("recommendation_items"),
+            func.row_number()
+            .over(
+                partition_by=XStrategyRecommendation.workspace_id,
+                order_by=XStrategyRecommendation.created_at.desc(),
+            )
+            .label("position"),
+        )
+        .where(XStrategyRecommendation.workspace_id.in_(unique_ids))
+        .subquery("ranked_recommendations")
+    )
+
+    patterns = {
+        row.workspace_id: row
+        for row in session.execute(select(pattern_ranked).where(pattern_ranked.c.position == 1))
+    }
+    recommendations = {
+        row.workspace_id: row
+        for row in session.execute(select(recommendation_ranked).where(recommendation_ranked.c.position == 1))
+    }
+    watchlist_counts: Dict[str, int] = {
+        workspace_id: int(count or 0)
+        for workspace_id, count in session.execute(
+            select(XStrategyWatchlist.workspace_id, func.count())
+            .where(
+                XStrategyWatchlist.workspace_id.in_(unique_ids),
+                XStrategyWatchlist.status == "active",
+            )
+            .group_by(XStrategyWatchlist.workspace_id)
+        )
+    }
+
+    return {
+        workspace_id: _build_strategy_report(
+            workspace_id=workspace_id,
+            watchlist_count=watchlist_counts.get(workspace_id, 0),
+            pattern=patterns.get(workspace_id),
+            recommendation=recommendations.get(workspace_id),
+        )
+        for workspace_id in unique_ids
     }
@@ -2,25 +2,43 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 import uuid
+import weakref
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import Engine, String, and_, bindparam, insert, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from src.storage.models import Role, User, Workspace, WorkspaceUser
-from src.storage.security import hash_password, verify_password
+from src.storage.security import hash_password, verify_password, verify_password_cached
 
 
 DEFAULT_ROLES = ("owner", "admin", "member")
 
 
+# Engines whose roles table is known to hold DEFAULT_ROLES. Weak references so
+# disposed test engines never alias a new one.
+_roles_initialized: weakref.WeakSet[Engine] = weakref.WeakSet()
+
+
 def ensure_default_roles(session: Session) -> None:
+    bind = session.get_bind()
+    engine = getattr(bind, "engine", bind)
+    if engine in _roles_initialized:
+        return
+
     existing = set(session.scalars(select(Role.name)).all())
-    missing = [Role(name=name) for name in DEFAULT_ROLES if name not in existing]
+    missing = [{"name": name} for name in DEFAULT_ROLES if name not in existing]
     if missing:
-        session.add_all(missing)
+        session.execute(insert(Role), missing)
         session.commit()
+    _roles_initialized.add(engine)
+
+
+def reset_default_roles_cache() -> None:
+    _roles_initialized.clear()
 
 
 def create_workspace_with_owner(
@@ -30,48 +48,94 @@ def create_workspace_with_owner(
     owner_email: str,
     owner_password: str,
 ) -> tuple[Workspace, User, str]:
-    existing_workspace = session.scalar(select(Workspace).where(Workspace.name == workspace_name))
-    if existing_workspace is not None:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Workspace name already exists",
-        )
-
     ensure_default_roles(session)
-    owner_role = session.scalar(select(Role).where(Role.name == "owner"))
+    owner_role = session.execute(select(Role.id, Role.name).where(Role.name == "owner")).one_or_none()
     if owner_role is None:  # pragma: no cover
         raise RuntimeError("Owner role was not initialized")
+    owner_role_id, owner_role_name = owner_role
 
-    user = session.scalar(select(User).where(User.email == owner_email))
+    user = session.scalar(_user_by_email_stmt(), {"email": owner_email})
     if user is None:
         user = User(id=str(uuid.uuid4()), email=owner_email, password_hash=hash_password(owner_password))
         session.add(user)
-        session.flush()
     elif not verify_password(owner_password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Owner email already exists with different credentials",
         )
 
+    # All primary keys are client-generated, so the three inserts go out in a
+    # single flush at commit time.
     workspace = Workspace(
         id=str(uuid.uuid4()),
         name=workspace_name,
         plan="free",
         subscription_status="inactive",
     )
-    session.add(workspace)
-    session.flush()
-
     membership = WorkspaceUser(
         id=str(uuid.uuid4()),
         workspace_id=workspace.id,
         user_id=user.id,
-        role_id=owner_role.id,
+        role_id=owner_role_id,
     )
-    session.add(membership)
-    session.commit()
+    session.add_all([workspace, membership])
+    # workspaces.name is unique; let the insert detect duplicates instead of
+    # probing with a SELECT first. The same commit also inserts the owner and
+    # membership, so only report a name clash when the name really exists.
+    try:
+        session.commit()
+    except IntegrityError:
+        session.rollback()
+        name_taken = session.scalar(select(Workspace.id).where(Workspace.name == workspace_name))
+        if name_taken is None:
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Workspace name already exists",
+        ) from None
+
+    return workspace, user, owner_role_name
+
+
+# Login and membership checks run on every authenticated request; the
+# statements are built once and only their parameters are bound per call.
+@lru_cache(maxsize=1)
+def _user_by_email_stmt():
+    return select(User).where(User.email == bindparam("email", type_=String()))
+
+
+@lru_cache(maxsize=1)
+def _membership_login_stmt():
+    # User, membership and role in one statement; the outer joins keep the
+    # 401 (unknown user) vs 403 (not a member) distinction.
+    return (
+        select(User, WorkspaceUser, Role.name)
+        .outerjoin(
+            WorkspaceUser,
+            and_(
+                WorkspaceUser.user_id == User.id,
+                WorkspaceUser.workspace_id == bindparam("workspace_id", type_=String()),
+            ),
+        )
+        .outerjoin(Role, Role.id == WorkspaceUser.role_id)
+        .where(User.email == bindparam("email", type_=String()), User.is_active.is_(True))
+    )
+
 
-    return workspace, user, owner_role.name
+@lru_cache(maxsize=1)
+def _workspace_membership_stmt():
+    return (
+        select(Workspace, WorkspaceUser.id, Role.name)
+        .outerjoin(
+            WorkspaceUser,
+            and_(
+                WorkspaceUser.workspace_id == Workspace.id,
+                WorkspaceUser.user_id == bindparam("user_id", type_=String()),
+            ),
+        )
+        .outerjoin(Role, Role.id == WorkspaceUser.role_id)
+        .where(Workspace.id == bindparam("workspace_id", type_=String()))
+    )
 
 
 def authenticate_workspace_user(
@@ -81,21 +145,19 @@ def authenticate_workspace_user(
     password: str,
     workspace_id: str,
 ) -> tuple[User, WorkspaceUser, str]:
-    user = session.scalar(select(User).where(User.email == email, User.is_active.is_(True)))
-    if user is None or not verify_password(password, user.password_hash):
+    row = session.execute(
+        _membership_login_stmt(),
+        {"email": email, "workspace_id": workspace_id},
+    ).first()
+    if row is None or not verify_password_cached(password, row[0].password_hash):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
-    membership = session.scalar(
-        select(WorkspaceUser)
-        .where(WorkspaceUser.user_id == user.id, WorkspaceUser.workspace_id == workspace_id)
-    )
+    user, membership, role_name = row
     if membership is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User is not a member of this workspace",
         )
-
-    role_name = session.scalar(select(Role.name).where(Role.id == membership.role_id))
     if role_name is None:  # pragma: no cover
         raise RuntimeError("Role lookup failed")
 
@@ -103,21 +165,19 @@ def authenticate_workspace_user(
 
 
 def get_workspace_for_member(session: Session, workspace_id: str, user_id: str) -> tuple[Workspace, str]:
-    workspace = session.scalar(select(Workspace).where(Workspace.id == workspace_id))
-    if workspace is None:
+    row = session.execute(
+        _workspace_membership_stmt(),
+        {"workspace_id": workspace_id, "user_id": user_id},
+    ).first()
+    if row is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workspace not found")
 
-    membership = session.scalar(
-        select(WorkspaceUser)
-        .where(WorkspaceUser.workspace_id == workspace_id, WorkspaceUser.user_id == user_id)
-    )
-    if membership is None:
+    workspace, membership_id, role_name = row
+    if membership_id is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not allowed to access this workspace",
         )
-
-    role_name = session.scalar(select(Role.name).where(Role.id == membership.role_id))
     if role_name is None:  # pragma: no cover
         raise RuntimeError("Role lookup failed")
 
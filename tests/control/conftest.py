@@ -1,34 +1,54 @@
 from __future__ import annotations
 
+from bisect import bisect_left, insort
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+import sqlite3
+from typing import Dict, List, Optional
 import uuid
 
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, select
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 import yaml
 
 import src.api.main as api_main
 import src.control.telegram_bot as control_bot
+import src.storage.security as storage_security
 from src.control.security import reset_admin_directory_cache
 from src.core.config import get_settings
+from src.integrations.x.service import upsert_workspace_x_tokens
 from src.integrations.x.x_client import get_x_client
-from src.storage.db import Base, get_session, load_models
-from src.storage.models import User
+from src.storage.db import Base, dialect_insert, get_session, load_models
+from src.storage.models import WorkspaceControlSetting
 from src.storage.security import get_token_key
+from src.workspaces.service import reset_default_roles_cache
+
+
+TEST_PBKDF2_ROUNDS = 1_000
 
 
 class FakeRedis:
     def __init__(self) -> None:
         self._store: Dict[str, str] = {}
+        # Sorted key index so prefix scans in keys() bisect instead of walking the store.
+        self._sorted_keys: List[str] = []
+
+    def _discard(self, key: str) -> bool:
+        if self._store.pop(key, None) is None:
+            return False
+        del self._sorted_keys[bisect_left(self._sorted_keys, key)]
+        return True
 
     def set(self, key: str, value: str, nx: bool = False, ex: int | None = None):
         del ex
-        if nx and key in self._store:
-            return False
+        if key in self._store:
+            if nx:
+                return False
+        else:
+            insort(self._sorted_keys, key)
         self._store[key] = str(value)
         return True
 
@@ -36,7 +56,7 @@ class FakeRedis:
         return self._store.get(key)
 
     def delete(self, key: str):
-        return 1 if self._store.pop(key, None) is not None else 0
+        return 1 if self._discard(key) else 0
 
     def exists(self, key: str):
         return 1 if key in self._store else 0
@@ -45,12 +65,18 @@ class FakeRedis:
         if "*" not in pattern:
             return [pattern] if pattern in self._store else []
         prefix = pattern.split("*", 1)[0]
-        return [key for key in self._store if key.startswith(prefix)]
+        sorted_keys = self._sorted_keys
+        index = bisect_left(sorted_keys, prefix)
+        matches: List[str] = []
+        while index < len(sorted_keys) and sorted_keys[index].startswith(prefix):
+            matches.append(sorted_keys[index])
+            index += 1
+        return matches
 
     def eval(self, script: str, numkeys: int, key: str, token: str):
         del script, numkeys
         if self._store.get(key) == token:
-            self._store.pop(key, None)
+            self._discard(key)
             return 1
         return 0
 
@@ -79,19 +105,55 @@ class ControlTestContext:
     admins_file_path: Path
 
 
-def _build_sqlite_session_factory() -> sessionmaker:
+@lru_cache(maxsize=1)
+def _schema_template() -> sqlite3.Connection:
+    # DDL runs once per test session; each test clones the empty schema.
     load_models()
+    template = sqlite3.connect(":memory:", check_same_thread=False)
+    template_engine = create_engine("sqlite+pysqlite://", creator=lambda: template, poolclass=StaticPool)
+    Base.metadata.create_all(template_engine)
+    return template
+
+
+@dataclass(frozen=True)
+class _WorkspaceSnapshot:
+    database: sqlite3.Connection
+    workspace_id: str
+    access_token: str
+    owner_user_id: str
+    owner_email: str
+
+
+# Database copy taken right after the first API bootstrap; later contexts clone
+# it instead of repeating signup + login (and their password hashing).
+_workspace_snapshot: Optional[_WorkspaceSnapshot] = None
+
+
+def _build_sqlite_session_factory(template: Optional[sqlite3.Connection] = None) -> sessionmaker:
+    if template is None:
+        template = _schema_template()
+
+    def _clone_template() -> sqlite3.Connection:
+        connection = sqlite3.connect(":memory:", check_same_thread=False)
+        template.backup(connection)
+        return connection
+
     engine = create_engine(
         "sqlite+pysqlite://",
-        connect_args={"check_same_thread": False},
+        creator=_clone_template,
         poolclass=StaticPool,
         future=True,
     )
-    Base.metadata.create_all(engine)
     return sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
 
 
-def _bootstrap_workspace(client: TestClient, *, workspace_name: str, owner_email: str, owner_password: str) -> tuple[str, str]:
+def _bootstrap_workspace(
+    client: TestClient,
+    *,
+    workspace_name: str,
+    owner_email: str,
+    owner_password: str,
+) -> tuple[str, str, str]:
     create_response = client.post(
         "/workspaces",
         json={
@@ -102,6 +164,7 @@ def _bootstrap_workspace(client: TestClient, *, workspace_name: str, owner_email
     )
     assert create_response.status_code == 201
     workspace_id = create_response.json()["workspace_id"]
+    owner_user_id = create_response.json()["owner_user_id"]
 
     login_response = client.post(
         "/auth/login",
@@ -113,7 +176,7 @@ def _bootstrap_workspace(client: TestClient, *, workspace_name: str, owner_email
     )
     assert login_response.status_code == 200
     token = login_response.json()["access_token"]
-    return workspace_id, token
+    return workspace_id, owner_user_id, token
 
 
 def _write_admins_file(
@@ -137,18 +200,52 @@ def _write_admins_file(
     path.write_text(yaml.safe_dump(payload), encoding="utf-8")
 
 
+def connect_x_integration(context: ControlTestContext) -> None:
+    """Store the workspace X tokens directly instead of posting to the manual token endpoint."""
+
+    with context.session_factory() as session:
+        upsert_workspace_x_tokens(
+            session,
+            workspace_id=context.workspace_id,
+            access_token="phase12-x-access-token",
+            refresh_token="phase12-x-refresh-token",
+            scope="tweet.read tweet.write users.read",
+            expires_in=3600,
+        )
+
+
+def set_workspace_mode(session: Session, *, workspace_id: str, mode: str) -> None:
+    """Upsert the workspace operational mode without committing."""
+
+    statement = dialect_insert(session, WorkspaceControlSetting).values(
+        workspace_id=workspace_id,
+        is_paused=False,
+        operational_mode=mode,
+    )
+    session.execute(
+        statement.on_conflict_do_update(
+            index_elements=[WorkspaceControlSetting.workspace_id],
+            set_={"operational_mode": mode},
+        )
+    )
+
+
 def create_control_test_context(monkeypatch, tmp_path: Path, *, include_in_allowed: bool = True) -> ControlTestContext:
     admins_path = tmp_path / "telegram_admins.yaml"
 
     monkeypatch.setenv("TOKEN_ENCRYPTION_KEY", "Y4Cpe2s2aQvRIvF8y17kF8s0w58K7tY6xE8DAXmXGJQ=")
     monkeypatch.setenv("TELEGRAM_WEBHOOK_SECRET", "phase12-secret")
     monkeypatch.setenv("TELEGRAM_ADMINS_FILE_PATH", str(admins_path))
+    # Hashes record their own round count, so test-only hashes stay verifiable.
+    monkeypatch.setattr(storage_security, "PBKDF2_ROUNDS", TEST_PBKDF2_ROUNDS)
 
     get_settings.cache_clear()
     get_token_key.cache_clear()
     reset_admin_directory_cache()
 
-    session_factory = _build_sqlite_session_factory()
+    global _workspace_snapshot
+    snapshot = _workspace_snapshot
+    session_factory = _build_sqlite_session_factory(snapshot.database if snapshot is not None else None)
     fake_redis = FakeRedis()
     fake_x = FakePublisherXClient()
 
@@ -165,19 +262,34 @@ def create_control_test_context(monkeypatch, tmp_path: Path, *, include_in_allow
 
     client = TestClient(api_main.app)
 
-    owner_email = f"owner-{uuid.uuid4()}@revfirst.io"
     owner_password = "owner-pass-123"
-    workspace_id, token = _bootstrap_workspace(
-        client,
-        workspace_name=f"phase12-{uuid.uuid4()}",
-        owner_email=owner_email,
-        owner_password=owner_password,
-    )
-
-    with session_factory() as session:
-        owner_user = session.scalar(select(User).where(User.email == owner_email))
-        assert owner_user is not None
-        owner_user_id = owner_user.id
+    if snapshot is None:
+        owner_email = f"owner-{uuid.uuid4()}@revfirst.io"
+        workspace_id, owner_user_id, token = _bootstrap_workspace(
+            client,
+            workspace_name=f"phase12-{uuid.uuid4()}",
+            owner_email=owner_email,
+            owner_password=owner_password,
+        )
+
+        database = sqlite3.connect(":memory:", check_same_thread=False)
+        raw_connection = session_factory.kw["bind"].raw_connection()
+        try:
+            raw_connection.driver_connection.backup(database)
+        finally:
+            raw_connection.close()
+        _workspace_snapshot = _WorkspaceSnapshot(
+            database=database,
+            workspace_id=workspace_id,
+            access_token=token,
+            owner_user_id=owner_user_id,
+            owner_email=owner_email,
+        )
+    else:
+        owner_email = snapshot.owner_email
+        workspace_id = snapshot.workspace_id
+        token = snapshot.access_token
+        owner_user_id = snapshot.owner_user_id
 
     _write_admins_file(
         admins_path,
@@ -206,3 +318,4 @@ def teardown_control_test_context() -> None:
     get_settings.cache_clear()
     get_token_key.cache_clear()
     reset_admin_directory_cache()
+    reset_default_roles_cache()
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 import json
+from typing import Any, Callable
+
+import pytest
 from sqlalchemy import select
 
 import src.channels.blog.publisher as blog_publisher_module
@@ -9,25 +13,26 @@ import src.channels.email.publisher as email_publisher_module
 import src.channels.instagram.publisher as instagram_publisher_module
 import src.control.handlers.approve as approve_handler_module
 from src.control.services import create_queue_item
-from src.storage.models import ApprovalQueueItem, WorkspaceControlSetting, WorkspaceEvent
-from tests.control.conftest import create_control_test_context, teardown_control_test_context
+from src.storage.models import ApprovalQueueItem, WorkspaceEvent
+from tests.control.conftest import (
+    connect_x_integration,
+    create_control_test_context,
+    set_workspace_mode,
+    teardown_control_test_context,
+)
+
+
+def _webhook_update(update_id: int, message_id: int, text: str) -> dict:
+    return {
+        "update_id": update_id,
+        "message": {"message_id": message_id, "chat": {"id": 7001}, "from": {"id": 90001}, "text": text},
+    }
 
 
 def test_queue_and_approve_schedule_reply_then_publish_now(monkeypatch, tmp_path) -> None:
     context = create_control_test_context(monkeypatch, tmp_path)
     try:
-        manual_token = context.client.post(
-            "/integrations/x/oauth/token/manual",
-            json={
-                "workspace_id": context.workspace_id,
-                "access_token": "phase12-x-access-token",
-                "refresh_token": "phase12-x-refresh-token",
-                "expires_in": 3600,
-                "scope": "tweet.read tweet.write users.read",
-            },
-            headers={"Authorization": f"Bearer {context.access_token}"},
-        )
-        assert manual_token.status_code == 200
+        connect_x_integration(context)
 
         with context.session_factory() as session:
             queue_item = create_queue_item(
@@ -50,15 +55,7 @@ def test_queue_and_approve_schedule_reply_then_publish_now(monkeypatch, tmp_path
 
         queue_response = context.client.post(
             f"/control/telegram/webhook/{context.workspace_id}",
-            json={
-                "update_id": 4001,
-                "message": {
-                    "message_id": 901,
-                    "chat": {"id": 7001},
-                    "from": {"id": 90001},
-                    "text": "/queue",
-                },
-            },
+            json=_webhook_update(4001, 901, "/queue"),
             headers={"X-Telegram-Bot-Api-Secret-Token": "phase12-secret"},
         )
         assert queue_response.status_code == 200
@@ -72,15 +69,7 @@ def test_queue_and_approve_schedule_reply_then_publish_now(monkeypatch, tmp_path
 
         approve_response = context.client.post(
             f"/control/telegram/webhook/{context.workspace_id}",
-            json={
-                "update_id": 4002,
-                "message": {
-                    "message_id": 902,
-                    "chat": {"id": 7001},
-                    "from": {"id": 90001},
-                    "text": f"/approve {queue_id}",
-                },
-            },
+            json=_webhook_update(4002, 902, f"/approve {queue_id}"),
             headers={"X-Telegram-Bot-Api-Secret-Token": "phase12-secret"},
         )
         assert approve_response.status_code == 200
@@ -92,15 +81,7 @@ def test_queue_and_approve_schedule_reply_then_publish_now(monkeypatch, tmp_path
 
         publish_now_response = context.client.post(
             f"/control/telegram/webhook/{context.workspace_id}",
-            json={
-                "update_id": 40021,
-                "message": {
-                    "message_id": 9021,
-                    "chat": {"id": 7001},
-                    "from": {"id": 90001},
-                    "text": f"/approve_now {queue_id}",
-                },
-            },
+            json=_webhook_update(40021, 9021, f"/approve_now {queue_id}"),
             headers={"X-Telegram-Bot-Api-Secret-Token": "phase12-secret"},
         )
         assert publish_now_response.status_code == 200
@@ -110,13 +91,9 @@ def test_queue_and_approve_schedule_reply_then_publish_now(monkeypatch, tmp_path
         assert publish_now_payload["data"]["external_post_id"] == "tweet-1"
 
         with context.session_factory() as session:
-            row = session.scalar(
-                select(ApprovalQueueItem).where(
-                    ApprovalQueueItem.workspace_id == context.workspace_id,
-                    ApprovalQueueItem.id == queue_id,
-                )
-            )
+            row = session.get(ApprovalQueueItem, queue_id)
             assert row is not None
+            assert row.workspace_id == context.workspace_id
             assert row.status == "published"
             assert row.published_post_id == "tweet-1"
     finally:
@@ -126,35 +103,11 @@ def test_queue_and_approve_schedule_reply_then_publish_now(monkeypatch, tmp_path
 def test_queue_approve_now_blocks_publish_in_containment_without_owner_override(monkeypatch, tmp_path) -> None:
     context = create_control_test_context(monkeypatch, tmp_path)
     try:
-        manual_token = context.client.post(
-            "/integrations/x/oauth/token/manual",
-            json={
-                "workspace_id": context.workspace_id,
-                "access_token": "phase12-x-access-token",
-                "refresh_token": "phase12-x-refresh-token",
-                "expires_in": 3600,
-                "scope": "tweet.read tweet.write users.read",
-            },
-            headers={"Authorization": f"Bearer {context.access_token}"},
-        )
-        assert manual_token.status_code == 200
+        connect_x_integration(context)
 
         with context.session_factory() as session:
-            setting = session.scalar(
-                select(WorkspaceControlSetting).where(WorkspaceControlSetting.workspace_id == context.workspace_id)
-            )
-            if setting is None:
-                setting = WorkspaceControlSetting(
-                    workspace_id=context.workspace_id,
-                    is_paused=False,
-                    operational_mode="semi_autonomous",
-                    channels_json='{"blog":false,"email":false,"instagram":false,"x":true}',
-                )
-                session.add(setting)
-                session.flush()
-            setting.operational_mode = "containment"
-            session.commit()
-
+            set_workspace_mode(session, workspace_id=context.workspace_id, mode="containment")
+            # create_queue_item commits, which also persists the mode change.
             queue_item = create_queue_item(
                 session,
                 workspace_id=context.workspace_id,
@@ -175,15 +128,7 @@ def test_queue_approve_now_blocks_publish_in_containment_without_owner_override(
 
         approve_response = context.client.post(
             f"/control/telegram/webhook/{context.workspace_id}",
-            json={
-                "update_id": 4003,
-                "message": {
-                    "message_id": 903,
-                    "chat": {"id": 7001},
-                    "from": {"id": 90001},
-                    "text": f"/approve_now {queue_id}",
-                },
-            },
+            json=_webhook_update(4003, 903, f"/approve_now {queue_id}"),
             headers={"X-Telegram-Bot-Api-Secret-Token": "phase12-secret"},
         )
         assert approve_response.status_code == 200
@@ -193,13 +138,9 @@ def test_queue_approve_now_blocks_publish_in_containment_without_owner_override(
         assert "operational mode" in str(approve_payload["data"]["error"]).lower()
 
         with context.session_factory() as session:
-            row = session.scalar(
-                select(ApprovalQueueItem).where(
-                    ApprovalQueueItem.workspace_id == context.workspace_id,
-                    ApprovalQueueItem.id == queue_id,
-                )
-            )
+            row = session.get(ApprovalQueueItem, queue_id)
             assert row is not None
+            assert row.workspace_id == context.workspace_id
             assert row.status == "failed"
     finally:
         teardown_control_test_context()
@@ -208,35 +149,11 @@ def test_queue_approve_now_blocks_publish_in_containment_without_owner_override(
 def test_queue_approve_now_allows_owner_override_in_containment(monkeypatch, tmp_path) -> None:
     context = create_control_test_context(monkeypatch, tmp_path)
     try:
-        manual_token = context.client.post(
-            "/integrations/x/oauth/token/manual",
-            json={
-                "workspace_id": context.workspace_id,
-                "access_token": "phase12-x-access-token",
-                "refresh_token": "phase12-x-refresh-token",
-                "expires_in": 3600,
-                "scope": "tweet.read tweet.write users.read",
-            },
-            headers={"Authorization": f"Bearer {context.access_token}"},
-        )
-        assert manual_token.status_code == 200
+        connect_x_integration(context)
 
         with context.session_factory() as session:
-            setting = session.scalar(
-                select(WorkspaceControlSetting).where(WorkspaceControlSetting.workspace_id == context.workspace_id)
-            )
-            if setting is None:
-                setting = WorkspaceControlSetting(
-                    workspace_id=context.workspace_id,
-                    is_paused=False,
-                    operational_mode="semi_autonomous",
-                    channels_json='{"blog":false,"email":false,"instagram":false,"x":true}',
-                )
-                session.add(setting)
-                session.flush()
-            setting.operational_mode = "containment"
-            session.commit()
-
+            set_workspace_mode(session, workspace_id=context.workspace_id, mode="containment")
+            # create_queue_item commits, which also persists the mode change.
             queue_item = create_queue_item(
                 session,
                 workspace_id=context.workspace_id,
@@ -257,15 +174,7 @@ def test_queue_approve_now_allows_owner_override_in_containment(monkeypatch, tmp
 
         approve_response = context.client.post(
             f"/control/telegram/webhook/{context.workspace_id}",
-            json={
-                "update_id": 4004,
-                "message": {
-                    "message_id": 904,
-                    "chat": {"id": 7001},
-                    "from": {"id": 90001},
-                    "text": f"/approve_now {queue_id} override",
-                },
-            },
+            json=_webhook_update(4004, 904, f"/approve_now {queue_id} override"),
             headers={"X-Telegram-Bot-Api-Secret-Token": "phase12-secret"},
         )
         assert approve_response.status_code == 200
@@ -309,174 +218,124 @@ class _FakeInstagramGraphClient:
         }
 
 
-def test_queue_and_approve_publish_email(monkeypatch, tmp_path) -> None:
+def _install_fake_resend(monkeypatch) -> None:
     monkeypatch.setenv("EMAIL_FROM_ADDRESS", "noreply@revfirst.cloud")
     monkeypatch.setenv("EMAIL_DEFAULT_RECIPIENTS", "ops@revfirst.io")
     fake_resend = _FakeResendClient()
     monkeypatch.setattr(email_publisher_module, "get_resend_client", lambda: fake_resend)
 
-    context = create_control_test_context(monkeypatch, tmp_path)
-    try:
-        with context.session_factory() as session:
-            queue_item = create_queue_item(
-                session,
-                workspace_id=context.workspace_id,
-                item_type="email",
-                content_text="Daily founder digest content",
-                source_kind="manual_test",
-                source_ref_id="daily-post-1",
-                intent="daily_post",
-                opportunity_score=100,
-                idempotency_key="test-queue-email-approve-1",
-                metadata={
-                    "subject": "Daily founder digest",
-                    "recipients": ["ops@revfirst.io"],
-                },
-            )
-            queue_id = queue_item.id
 
-        approve_response = context.client.post(
-            f"/control/telegram/webhook/{context.workspace_id}",
-            json={
-                "update_id": 4102,
-                "message": {
-                    "message_id": 912,
-                    "chat": {"id": 7001},
-                    "from": {"id": 90001},
-                    "text": f"/approve_now {queue_id}",
-                },
-            },
-            headers={"X-Telegram-Bot-Api-Secret-Token": "phase12-secret"},
-        )
-        assert approve_response.status_code == 200
-        approve_payload = approve_response.json()
-        assert approve_payload["accepted"] is True
-        assert approve_payload["message"] == "approved_and_published"
-        assert approve_payload["data"]["external_post_id"] == "email-1"
-
-        with context.session_factory() as session:
-            row = session.scalar(
-                select(ApprovalQueueItem).where(
-                    ApprovalQueueItem.workspace_id == context.workspace_id,
-                    ApprovalQueueItem.id == queue_id,
-                )
-            )
-            assert row is not None
-            assert row.status == "published"
-            assert row.published_post_id == "email-1"
-    finally:
-        teardown_control_test_context()
-
-
-def test_queue_and_approve_publish_blog(monkeypatch, tmp_path) -> None:
+def _install_fake_blog(monkeypatch) -> None:
     monkeypatch.setenv("BLOG_WEBHOOK_URL", "https://blog-webhook.local/publish")
     fake_blog = _FakeBlogWebhookClient()
     monkeypatch.setattr(blog_publisher_module, "get_blog_webhook_client", lambda: fake_blog)
 
-    context = create_control_test_context(monkeypatch, tmp_path)
-    try:
-        with context.session_factory() as session:
-            queue_item = create_queue_item(
-                session,
-                workspace_id=context.workspace_id,
-                item_type="blog",
-                content_text="## Weekly field notes\n\nDirect positioning keeps conversations qualified.",
-                source_kind="manual_test",
-                source_ref_id="daily-post-blog-1",
-                intent="daily_post",
-                opportunity_score=100,
-                idempotency_key="test-queue-blog-approve-1",
-                metadata={
-                    "title": "Weekly field notes",
-                },
-            )
-            queue_id = queue_item.id
-
-        approve_response = context.client.post(
-            f"/control/telegram/webhook/{context.workspace_id}",
-            json={
-                "update_id": 4202,
-                "message": {
-                    "message_id": 922,
-                    "chat": {"id": 7001},
-                    "from": {"id": 90001},
-                    "text": f"/approve_now {queue_id}",
-                },
-            },
-            headers={"X-Telegram-Bot-Api-Secret-Token": "phase12-secret"},
-        )
-        assert approve_response.status_code == 200
-        approve_payload = approve_response.json()
-        assert approve_payload["accepted"] is True
-        assert approve_payload["message"] == "approved_and_published"
-        assert approve_payload["data"]["external_post_id"] == "blog-1"
 
-        with context.session_factory() as session:
-            row = session.scalar(
-                select(ApprovalQueueItem).where(
-                    ApprovalQueueItem.workspace_id == context.workspace_id,
-                    ApprovalQueueItem.id == queue_id,
-                )
-            )
-            assert row is not None
-            assert row.status == "published"
-            assert row.published_post_id == "blog-1"
-    finally:
-        teardown_control_test_context()
-
-
-def test_queue_and_approve_publish_instagram(monkeypatch, tmp_path) -> None:
+def _install_fake_instagram(monkeypatch) -> None:
     fake_instagram = _FakeInstagramGraphClient()
     monkeypatch.setattr(instagram_publisher_module, "get_instagram_graph_client", lambda: fake_instagram)
 
+
+@dataclass(frozen=True)
+class _PublishCase:
+    item_type: str
+    content_text: str
+    source_ref_id: str
+    idempotency_key: str
+    metadata: dict
+    update_id: int
+    message_id: int
+    expected_post_id: str
+    install_fakes: Callable[[Any], None]
+
+
+_PUBLISH_CASES = [
+    pytest.param(
+        _PublishCase(
+            item_type="email",
+            content_text="Daily founder digest content",
+            source_ref_id="daily-post-1",
+            idempotency_key="test-queue-email-approve-1",
+            metadata={
+                "subject": "Daily founder digest",
+                "recipients": ["ops@revfirst.io"],
+            },
+            update_id=4102,
+            message_id=912,
+            expected_post_id="email-1",
+            install_fakes=_install_fake_resend,
+        ),
+        id="email",
+    ),
+    pytest.param(
+        _PublishCase(
+            item_type="blog",
+            content_text="## Weekly field notes\n\nDirect positioning keeps conversations qualified.",
+            source_ref_id="daily-post-blog-1",
+            idempotency_key="test-queue-blog-approve-1",
+            metadata={"title": "Weekly field notes"},
+            update_id=4202,
+            message_id=922,
+            expected_post_id="blog-1",
+            install_fakes=_install_fake_blog,
+        ),
+        id="blog",
+    ),
+    pytest.param(
+        _PublishCase(
+            item_type="instagram",
+            content_text="Founder insight with one practical takeaway and zero hype.",
+            source_ref_id="daily-post-instagram-1",
+            idempotency_key="test-queue-instagram-approve-1",
+            metadata={"image_url": "https://cdn.revfirst.cloud/ig-post-1.jpg"},
+            update_id=4302,
+            message_id=932,
+            expected_post_id="instagram-1",
+            install_fakes=_install_fake_instagram,
+        ),
+        id="instagram",
+    ),
+]
+
+
+@pytest.mark.parametrize("case", _PUBLISH_CASES)
+def test_queue_and_approve_publish_channel(monkeypatch, tmp_path, case: _PublishCase) -> None:
+    case.install_fakes(monkeypatch)
+
     context = create_control_test_context(monkeypatch, tmp_path)
     try:
         with context.session_factory() as session:
             queue_item = create_queue_item(
                 session,
                 workspace_id=context.workspace_id,
-                item_type="instagram",
-                content_text="Founder insight with one practical takeaway and zero hype.",
+                item_type=case.item_type,
+                content_text=case.content_text,
                 source_kind="manual_test",
-                source_ref_id="daily-post-instagram-1",
+                source_ref_id=case.source_ref_id,
                 intent="daily_post",
                 opportunity_score=100,
-                idempotency_key="test-queue-instagram-approve-1",
-                metadata={
-                    "image_url": "https://cdn.revfirst.cloud/ig-post-1.jpg",
-                },
+                idempotency_key=case.idempotency_key,
+                metadata=case.metadata,
             )
             queue_id = queue_item.id
 
         approve_response = context.client.post(
             f"/control/telegram/webhook/{context.workspace_id}",
-            json={
-                "update_id": 4302,
-                "message": {
-                    "message_id": 932,
-                    "chat": {"id": 7001},
-                    "from": {"id": 90001},
-                    "text": f"/approve_now {queue_id}",
-                },
-            },
+            json=_webhook_update(case.update_id, case.message_id, f"/approve_now {queue_id}"),
             headers={"X-Telegram-Bot-Api-Secret-Token": "phase12-secret"},
         )
         assert approve_response.status_code == 200
         approve_payload = approve_response.json()
         assert approve_payload["accepted"] is True
         assert approve_payload["message"] == "approved_and_published"
-        assert approve_payload["data"]["external_post_id"] == "instagram-1"
+        assert approve_payload["data"]["external_post_id"] == case.expected_post_id
 
         with context.session_factory() as session:
-            row = session.scalar(
-                select(ApprovalQueueItem).where(
-                    ApprovalQueueItem.workspace_id == context.workspace_id,
-                    ApprovalQueueItem.id == queue_id,
-                )
-            )
+            row = session.get(ApprovalQueueItem, queue_id)
             assert row is not None
+            assert row.workspace_id == context.workspace_id
             assert row.status == "published"
-            assert row.published_post_id == "instagram-1"
+            assert row.published_post_id == case.expected_post_id
     finally:
         teardown_control_test_context()
 
@@ -508,15 +367,7 @@ def test_queue_and_approve_schedules_instagram_for_future(monkeypatch, tmp_path)
 
         approve_response = context.client.post(
             f"/control/telegram/webhook/{context.workspace_id}",
-            json={
-                "update_id": 4303,
-                "message": {
-                    "message_id": 933,
-                    "chat": {"id": 7001},
-                    "from": {"id": 90001},
-                    "text": f"/approve {queue_id}",
-                },
-            },
+            json=_webhook_update(4303, 933, f"/approve {queue_id}"),
             headers={"X-Telegram-Bot-Api-Secret-Token": "phase12-secret"},
         )
         assert approve_response.status_code == 200
@@ -527,13 +378,9 @@ def test_queue_and_approve_schedules_instagram_for_future(monkeypatch, tmp_path)
         assert fake_instagram.counter == 0
 
         with context.session_factory() as session:
-            row = session.scalar(
-                select(ApprovalQueueItem).where(
-                    ApprovalQueueItem.workspace_id == context.workspace_id,
-                    ApprovalQueueItem.id == queue_id,
-                )
-            )
+            row = session.get(ApprovalQueueItem, queue_id)
             assert row is not None
+            assert row.workspace_id == context.workspace_id
             assert row.status == "approved_scheduled"
             assert row.published_post_id is None
     finally:
@@ -573,15 +420,7 @@ def test_reject_triggers_guarded_auto_regeneration(monkeypatch, tmp_path) -> Non
 
         reject_response = context.client.post(
             f"/control/telegram/webhook/{context.workspace_id}",
-            json={
-                "update_id": 4991,
-                "message": {
-                    "message_id": 9951,
-                    "chat": {"id": 7001},
-                    "from": {"id": 90001},
-                    "text": f"/reject {queue_id}",
-                },
-            },
+            json=_webhook_update(4991, 9951, f"/reject {queue_id}"),
             headers={"X-Telegram-Bot-Api-Secret-Token": "phase12-secret"},
         )
         assert reject_response.status_code == 200
@@ -635,15 +474,7 @@ def test_reject_auto_regeneration_respects_daily_cap(monkeypatch, tmp_path) -> N
 
         reject_response = context.client.post(
             f"/control/telegram/webhook/{context.workspace_id}",
-            json={
-                "update_id": 4992,
-                "message": {
-                    "message_id": 9952,
-                    "chat": {"id": 7001},
-                    "from": {"id": 90001},
-                    "text": f"/reject {queue_id}",
-                },
-            },
+            json=_webhook_update(4992, 9952, f"/reject {queue_id}"),
             headers={"X-Telegram-Bot-Api-Secret-Token": "phase12-secret"},
         )
         assert reject_response.status_code == 200
@@ -699,15 +530,7 @@ def test_reject_regeneration_generates_image_when_preview_missing(monkeypatch, t
 
         reject_response = context.client.post(
             f"/control/telegram/webhook/{context.workspace_id}",
-            json={
-                "update_id": 4993,
-                "message": {
-                    "message_id": 9953,
-                    "chat": {"id": 7001},
-                    "from": {"id": 90001},
-                    "text": f"/reject {queue_id}",
-                },
-            },
+            json=_webhook_update(4993, 9953, f"/reject {queue_id}"),
             headers={"X-Telegram-Bot-Api-Secret-Token": "phase12-secret"},
         )
         assert reject_response.status_code == 200
@@ -7,24 +7,17 @@ from sqlalchemy import select
 from src.control.queue_executor import execute_approved_queue_items
 from src.control.services import create_queue_item
 from src.storage.models import ApprovalQueueItem
-from tests.control.conftest import create_control_test_context, teardown_control_test_context
+from tests.control.conftest import (
+    connect_x_integration,
+    create_control_test_context,
+    teardown_control_test_context,
+)
 
 
 def test_execute_due_scheduled_items_publishes_once(monkeypatch, tmp_path) -> None:
     context = create_control_test_context(monkeypatch, tmp_path)
     try:
-        manual_token = context.client.post(
-            "/integrations/x/oauth/token/manual",
-            json={
-                "workspace_id": context.workspace_id,
-                "access_token": "phase12-x-access-token",
-                "refresh_token": "phase12-x-refresh-token",
-                "expires_in": 3600,
-                "scope": "tweet.read tweet.write users.read",
-            },
-            headers={"Authorization": f"Bearer {context.access_token}"},
-        )
-        assert manual_token.status_code == 200
+        connect_x_integration(context)
 
         with context.session_factory() as session:
             item = create_queue_item(
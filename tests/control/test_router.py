@@ -10,7 +10,11 @@ import src.control.handlers.stability as stability_handler_module
 import src.control.handlers.strategy as strategy_handler_module
 from src.control.services import create_queue_item
 from src.storage.models import ApprovalQueueItem, PipelineRun
-from tests.control.conftest import create_control_test_context, teardown_control_test_context
+from tests.control.conftest import (
+    connect_x_integration,
+    create_control_test_context,
+    teardown_control_test_context,
+)
 
 
 def test_control_router_sends_chat_reply_when_command_processed(monkeypatch, tmp_path) -> None:
@@ -473,18 +477,7 @@ def test_control_router_preview_sends_photo_for_queue_item(monkeypatch, tmp_path
 def test_control_router_plain_text_sim_approves_latest_pending_item(monkeypatch, tmp_path) -> None:
     context = create_control_test_context(monkeypatch, tmp_path)
     try:
-        manual_token = context.client.post(
-            "/integrations/x/oauth/token/manual",
-            json={
-                "workspace_id": context.workspace_id,
-                "access_token": "phase12-x-access-token",
-                "refresh_token": "phase12-x-refresh-token",
-                "expires_in": 3600,
-                "scope": "tweet.read tweet.write users.read",
-            },
-            headers={"Authorization": f"Bearer {context.access_token}"},
-        )
-        assert manual_token.status_code == 200
+        connect_x_integration(context)
 
         with context.session_factory() as session:
             queue_item = create_queue_item(
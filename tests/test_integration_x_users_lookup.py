@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+import src.integrations.x.x_client as x_client_module
+from src.integrations.x.x_client import USERS_LOOKUP_BATCH_SIZE, XClient, XClientError
+
+
+def _build_client() -> XClient:
+    return XClient(
+        token_url="https://api.x.test/2/oauth2/token",
+        authorize_url="https://x.test/i/oauth2/authorize",
+        search_url="https://api.x.test/2/tweets/search/recent",
+        publish_url="https://api.x.test/2/tweets",
+        users_me_url="https://api.x.test/2/users/me",
+        user_lookup_url="https://api.x.test/2/users/{user_id}",
+        user_tweets_url="https://api.x.test/2/users/{user_id}/tweets",
+        tweet_lookup_url="https://api.x.test/2/tweets/{tweet_id}",
+        client_id="client-id",
+        client_secret="client-secret",
+        redirect_uri="https://app.test/callback",
+        users_lookup_url="https://api.x.test/2/users",
+    )
+
+
+def _install_transport(monkeypatch, handler) -> list[httpx.Request]:
+    requests: list[httpx.Request] = []
+    original_client = httpx.Client
+
+    def recording_handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return handler(request)
+
+    def client_factory(*args, **kwargs):
+        kwargs["transport"] = httpx.MockTransport(recording_handler)
+        return original_client(*args, **kwargs)
+
+    monkeypatch.setattr(x_client_module.httpx, "Client", client_factory)
+    return requests
+
+
+def _users_payload(request: httpx.Request) -> dict:
+    ids = request.url.params["ids"].split(",")
+    return {
+        "data": [
+            {"id": user_id, "username": f"user{user_id}", "public_metrics": {"followers_count": int(user_id)}}
+            for user_id in ids
+        ]
+    }
+
+
+def test_users_lookup_batches_ids_in_chunks_of_100(monkeypatch) -> None:
+    requests = _install_transport(monkeypatch, lambda request: httpx.Response(200, json=_users_payload(request)))
+    user_ids = [str(1000 + index) for index in range(USERS_LOOKUP_BATCH_SIZE + 50)]
+
+    result = _build_client().get_users_public_metrics_batch(
+        access_token="token-1",
+        user_ids=user_ids + [" 1000 ", "1001", ""],
+    )
+
+    assert len(requests) == 2
+    first_ids = requests[0].url.params["ids"].split(",")
+    second_ids = requests[1].url.params["ids"].split(",")
+    assert first_ids == user_ids[:USERS_LOOKUP_BATCH_SIZE]
+    assert second_ids == user_ids[USERS_LOOKUP_BATCH_SIZE:]
+    for request in requests:
+        assert request.url.params["user.fields"] == "username,name,public_metrics"
+        assert request.headers["Authorization"] == "Bearer token-1"
+    assert sorted(result) == sorted(user_ids)
+    assert result["1042"]["public_metrics"]["followers_count"] == 1042
+
+
+def test_users_lookup_keeps_successful_chunks_when_one_chunk_fails(monkeypatch) -> None:
+    calls = {"count": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        if calls["count"] == 2:
+            return httpx.Response(429, json={"title": "Too Many Requests"})
+        return httpx.Response(200, json=_users_payload(request))
+
+    requests = _install_transport(monkeypatch, handler)
+    user_ids = [str(2000 + index) for index in range(USERS_LOOKUP_BATCH_SIZE * 2 + 10)]
+
+    result = _build_client().get_users_public_metrics_batch(access_token="token-1", user_ids=user_ids)
+
+    assert len(requests) == 3
+    failed_chunk = set(user_ids[USERS_LOOKUP_BATCH_SIZE : USERS_LOOKUP_BATCH_SIZE * 2])
+    assert set(result) == set(user_ids) - failed_chunk
+
+
+def test_users_lookup_raises_when_every_chunk_fails(monkeypatch) -> None:
+    _install_transport(monkeypatch, lambda request: httpx.Response(503))
+
+    with pytest.raises(XClientError, match="status 503"):
+        _build_client().get_users_public_metrics_batch(access_token="token-1", user_ids=["1", "2"])
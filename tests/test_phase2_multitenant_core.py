@@ -3,12 +3,14 @@ from __future__ import annotations
 import pytest
 from fastapi import HTTPException
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import bindparam, create_engine, false, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.pool import StaticPool
 from sqlalchemy.orm import sessionmaker
 
 import src.api.main as api_main
 from src.storage.db import Base, get_session, load_models
+from src.storage.models import User, Workspace
 from src.workspaces.service import create_workspace_with_owner
 
 
@@ -146,3 +148,114 @@ def test_phase2_existing_user_with_wrong_password_is_rejected() -> None:
         assert "different credentials" in exc_info.value.detail
     finally:
         session.close()
+
+
+def test_phase2_duplicate_workspace_name_is_rejected() -> None:
+    session_factory = _build_sqlite_session_factory()
+    session = session_factory()
+    try:
+        create_workspace_with_owner(
+            session,
+            workspace_name="tenant-one",
+            owner_email="owner@tenant.io",
+            owner_password="correct-password-1",
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            create_workspace_with_owner(
+                session,
+                workspace_name="tenant-one",
+                owner_email="other@tenant.io",
+                owner_password="correct-password-2",
+            )
+        assert exc_info.value.status_code == 409
+        assert exc_info.value.detail == "Workspace name already exists"
+        assert session.scalar(select(User).where(User.email == "other@tenant.io")) is None
+    finally:
+        session.close()
+
+
+def test_phase2_owner_credentials_are_checked_before_workspace_name() -> None:
+    # The name clash only surfaces at commit, so a bad owner password wins over it.
+    session_factory = _build_sqlite_session_factory()
+    session = session_factory()
+    try:
+        create_workspace_with_owner(
+            session,
+            workspace_name="tenant-one",
+            owner_email="owner@tenant.io",
+            owner_password="correct-password-1",
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            create_workspace_with_owner(
+                session,
+                workspace_name="tenant-one",
+                owner_email="owner@tenant.io",
+                owner_password="wrong-password",
+            )
+        assert exc_info.value.status_code == 409
+        assert exc_info.value.detail == "Owner email already exists with different credentials"
+    finally:
+        session.close()
+
+
+def test_phase2_concurrent_owner_email_conflict_is_not_reported_as_workspace_name(monkeypatch) -> None:
+    import src.workspaces.service as workspace_service
+
+    session_factory = _build_sqlite_session_factory()
+    session = session_factory()
+    try:
+        create_workspace_with_owner(
+            session,
+            workspace_name="tenant-one",
+            owner_email="owner@tenant.io",
+            owner_password="correct-password-1",
+        )
+
+        # Simulate a concurrent signup: the owner lookup misses, so the commit
+        # inserts a second user and trips users.email, not workspaces.name.
+        monkeypatch.setattr(
+            workspace_service,
+            "_user_by_email_stmt",
+            lambda: select(User).where(User.email == bindparam("email"), false()),
+        )
+        with pytest.raises(IntegrityError):
+            create_workspace_with_owner(
+                session,
+                workspace_name="tenant-two",
+                owner_email="owner@tenant.io",
+                owner_password="correct-password-1",
+            )
+        assert session.scalar(select(Workspace).where(Workspace.name == "tenant-two")) is None
+    finally:
+        session.close()
+
+
+def test_phase2_password_verification_is_cached_per_hash(monkeypatch) -> None:
+    import src.storage.security as security
+
+    security.reset_password_verify_cache()
+    encoded_hash = security.hash_password("supersecret123")
+    calls = []
+    original_verify = security.verify_password
+
+    def counting_verify(password: str, stored_hash: str) -> bool:
+        calls.append(stored_hash)
+        return original_verify(password, stored_hash)
+
+    monkeypatch.setattr(security, "verify_password", counting_verify)
+    try:
+        assert security.verify_password_cached("supersecret123", encoded_hash) is True
+        assert security.verify_password_cached("supersecret123", encoded_hash) is True
+        assert security.verify_password_cached("wrong-password", encoded_hash) is False
+        assert len(calls) == 2
+        # Failures are never cached, so a repeated wrong guess runs PBKDF2 again.
+        assert security.verify_password_cached("wrong-password", encoded_hash) is False
+        assert len(calls) == 3
+
+        rehashed = security.hash_password("supersecret123")
+        assert security.verify_password_cached("supersecret123", rehashed) is True
+        assert len(calls) == 4
+    finally:
+        security.reset_password_verify_cache()
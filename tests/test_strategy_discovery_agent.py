@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import datetime, timezone
 import uuid
 
 from sqlalchemy import create_engine, select
@@ -9,12 +10,26 @@ from sqlalchemy.pool import StaticPool
 from src.core.config import get_settings
 from src.integrations.x.service import upsert_workspace_x_tokens
 from src.storage.db import Base, load_models
-from src.storage.models import User, Workspace, XStrategyDiscoveryCandidate, XStrategyWatchlist
+from src.storage.models import (
+    User,
+    Workspace,
+    XCompetitorPost,
+    XStrategyDiscoveryCandidate,
+    XStrategyPattern,
+    XStrategyRecommendation,
+    XStrategyWatchlist,
+)
 from src.storage.security import get_token_key
 from src.strategy.x_growth_strategy_agent import (
     approve_strategy_candidate,
+    get_strategy_discovery_criteria,
+    latest_workspace_strategy_report,
+    latest_workspace_strategy_reports,
     list_pending_strategy_candidates,
     run_workspace_strategy_discovery,
+    run_workspace_strategy_scan,
+    upsert_watchlist_account,
+    upsert_watchlist_accounts,
 )
 
 
@@ -32,15 +47,17 @@ class _FakeStrategyDiscoveryXClient:
             },
         }
 
-    def get_user_public_metrics(self, *, access_token: str, user_id: str):  # noqa: ARG002
-        assert user_id == "1001"
+    def get_users_public_metrics_batch(self, *, access_token: str, user_ids: list[str]):  # noqa: ARG002
+        assert user_ids == ["1001"]
         return {
-            "id": "1001",
-            "username": "Tobby_scraper",
-            "public_metrics": {
-                "followers_count": 1800,
-                "tweet_count": 740,
-            },
+            "1001": {
+                "id": "1001",
+                "username": "Tobby_scraper",
+                "public_metrics": {
+                    "followers_count": 1800,
+                    "tweet_count": 740,
+                },
+            }
         }
 
     def get_user_recent_posts(self, *, access_token: str, user_id: str, max_results: int = 20):  # noqa: ARG002
@@ -84,6 +101,7 @@ class _FakeLowQualityStrategyDiscoveryXClient:
         return {
             "data": [
                 {"id": "t1", "author_id": "2002", "text": "building in public", "created_at": "2026-02-21T00:00:00Z"},
+                {"id": "t2", "author_id": "2002", "text": "shipping again", "created_at": "2026-02-21T03:00:00Z"},
             ],
             "includes": {
                 "users": [
@@ -92,15 +110,17 @@ class _FakeLowQualityStrategyDiscoveryXClient:
             },
         }
 
-    def get_user_public_metrics(self, *, access_token: str, user_id: str):  # noqa: ARG002
-        assert user_id == "2002"
+    def get_users_public_metrics_batch(self, *, access_token: str, user_ids: list[str]):  # noqa: ARG002
+        assert user_ids == ["2002"]
         return {
-            "id": "2002",
-            "username": "low_quality_account",
-            "public_metrics": {
-                "followers_count": 350,
-                "tweet_count": 1200,
-            },
+            "2002": {
+                "id": "2002",
+                "username": "low_quality_account",
+                "public_metrics": {
+                    "followers_count": 350,
+                    "tweet_count": 1200,
+                },
+            }
         }
 
     def get_user_recent_posts(self, *, access_token: str, user_id: str, max_results: int = 20):  # noqa: ARG002
@@ -139,6 +159,99 @@ class _FakeLowQualityStrategyDiscoveryXClient:
         ]
 
 
+class _FakePartialFailureStrategyDiscoveryXClient:
+    def search_open_calls(self, *, access_token: str, query: str | None = None, max_results: int = 20):  # noqa: ARG002
+        return {
+            "data": [
+                {"id": "t1", "author_id": "5001", "text": "building in public"},
+                {"id": "t2", "author_id": "5001", "text": "just launched"},
+                {"id": "t3", "author_id": "5002", "text": "building in public"},
+                {"id": "t4", "author_id": "5002", "text": "just launched"},
+            ],
+            "includes": {
+                "users": [
+                    {"id": "5001", "username": "missing_metrics"},
+                    {"id": "5002", "username": "timeline_down"},
+                ]
+            },
+        }
+
+    def get_users_public_metrics_batch(self, *, access_token: str, user_ids: list[str]):  # noqa: ARG002
+        assert user_ids == ["5001", "5002"]
+        return {"5002": {"id": "5002", "public_metrics": {"followers_count": 5000, "tweet_count": 10}}}
+
+    def get_user_recent_posts(self, *, access_token: str, user_id: str, max_results: int = 20):  # noqa: ARG002
+        assert user_id == "5002"
+        raise RuntimeError("timeline unavailable")
+
+
+class _FakeLowSignalStrategyDiscoveryXClient:
+    def search_open_calls(self, *, access_token: str, query: str | None = None, max_results: int = 20):  # noqa: ARG002
+        return {
+            "data": [
+                {"id": "t1", "author_id": "6001", "text": "building in public"},
+            ],
+            "includes": {
+                "users": [
+                    {"id": "6001", "username": "single_signal"},
+                    {"id": "6002", "username": "no_signal"},
+                ]
+            },
+        }
+
+    def get_users_public_metrics_batch(self, *, access_token: str, user_ids: list[str]):  # noqa: ARG002
+        raise AssertionError("low-signal users must not be looked up")
+
+    def get_user_recent_posts(self, *, access_token: str, user_id: str, max_results: int = 20):  # noqa: ARG002
+        raise AssertionError("low-signal users must not be fetched")
+
+
+class _FakeMixedSignalStrategyDiscoveryXClient(_FakeLowQualityStrategyDiscoveryXClient):
+    def search_open_calls(self, *, access_token: str, query: str | None = None, max_results: int = 20):  # noqa: ARG002
+        return {
+            "data": [
+                {"id": "t1", "author_id": "2002", "text": "building in public"},
+                {"id": "t2", "author_id": "2002", "text": "shipping again"},
+                {"id": "t3", "author_id": "7001", "text": "small account"},
+                {"id": "t4", "author_id": "7001", "text": "small account again"},
+                {"id": "t5", "author_id": "7002", "text": "single signal"},
+            ],
+            "includes": {
+                "users": [
+                    {"id": "2002", "username": "low_quality_account"},
+                    {"id": "7001", "username": "tiny_account"},
+                    {"id": "7002", "username": "single_signal"},
+                ]
+            },
+        }
+
+    def get_users_public_metrics_batch(self, *, access_token: str, user_ids: list[str]):  # noqa: ARG002
+        assert user_ids == ["2002", "7001"]
+        return {
+            "2002": {"id": "2002", "public_metrics": {"followers_count": 350, "tweet_count": 1200}},
+            "7001": {"id": "7001", "public_metrics": {"followers_count": 40, "tweet_count": 90}},
+        }
+
+
+class _FakeStrategyScanXClient:
+    def __init__(self) -> None:
+        self.like_count = 3
+
+    def get_user_recent_posts(self, *, access_token: str, user_id: str, max_results: int = 20):  # noqa: ARG002
+        if user_id == "1002":
+            raise RuntimeError("timeline unavailable")
+        return [
+            {
+                "id": "p1",
+                "text": "shipping the onboarding flow today",
+                "created_at": "2026-02-21T00:00:00Z",
+                "public_metrics": {"like_count": self.like_count, "reply_count": 1},
+            },
+            {"id": "p2", "text": "what broke in our pricing page", "created_at": "2026-02-21T06:00:00Z"},
+            {"id": "", "text": "missing id is ignored"},
+        ]
+
+
 def _build_sqlite_session_factory() -> sessionmaker:
     load_models()
     engine = create_engine(
@@ -315,3 +428,418 @@ def test_strategy_discovery_candidate_approval_moves_to_watchlist(monkeypatch) -
     finally:
         get_token_key.cache_clear()
         get_settings.cache_clear()
+
+
+def test_strategy_report_counts_active_watchlist_without_snapshot() -> None:
+    session_factory = _build_sqlite_session_factory()
+    workspace_id = str(uuid.uuid4())
+
+    with session_factory() as session:
+        session.add(
+            Workspace(
+                id=workspace_id,
+                name=f"workspace-{uuid.uuid4()}",
+                plan="free",
+                subscription_status="active",
+            )
+        )
+        session.commit()
+        upsert_watchlist_account(session, workspace_id=workspace_id, account_user_id="3001")
+        upsert_watchlist_account(session, workspace_id=workspace_id, account_user_id="3002")
+        paused = upsert_watchlist_account(session, workspace_id=workspace_id, account_user_id="3003")
+        paused.status = "paused"
+        session.commit()
+
+        report = latest_workspace_strategy_report(session, workspace_id=workspace_id)
+        assert report == {"workspace_id": workspace_id, "available": False, "watchlist_count": 2}
+
+
+def test_strategy_report_returns_latest_pattern_and_recommendations() -> None:
+    session_factory = _build_sqlite_session_factory()
+    workspace_id = str(uuid.uuid4())
+
+    with session_factory() as session:
+        session.add(
+            Workspace(
+                id=workspace_id,
+                name=f"workspace-{uuid.uuid4()}",
+                plan="free",
+                subscription_status="active",
+            )
+        )
+        session.commit()
+        upsert_watchlist_account(session, workspace_id=workspace_id, account_user_id="4001")
+        session.add(
+            XStrategyPattern(
+                id=str(uuid.uuid4()),
+                workspace_id=workspace_id,
+                period_window="14d",
+                pattern_json={"total_posts": 12},
+                confidence_score=36,
+                generated_at=datetime(2026, 2, 20, 12, 0, tzinfo=timezone.utc),
+                generated_at_iso="2026-02-20T12:00:00+00:00",
+            )
+        )
+        session.add(
+            XStrategyPattern(
+                id=str(uuid.uuid4()),
+                workspace_id=workspace_id,
+                period_window="7d",
+                pattern_json={"total_posts": 4},
+                confidence_score=12,
+                generated_at=datetime(2026, 2, 10, 12, 0, tzinfo=timezone.utc),
+            )
+        )
+        session.add(
+            XStrategyRecommendation(
+                id=str(uuid.uuid4()),
+                workspace_id=workspace_id,
+                period_window="14d",
+                recommendation_json={"items": ["Aumentar cadencia"]},
+                rationale_json="{}",
+            )
+        )
+        session.commit()
+
+        report = latest_workspace_strategy_report(session, workspace_id=workspace_id)
+        assert report["available"] is True
+        assert report["watchlist_count"] == 1
+        assert report["period_window"] == "14d"
+        assert report["pattern"] == {"total_posts": 12}
+        assert report["confidence_score"] == 36
+        assert report["recommendations"] == ["Aumentar cadencia"]
+        assert report["generated_at"] == "2026-02-20T12:00:00+00:00"
+
+        empty_workspace_id = str(uuid.uuid4())
+        reports = latest_workspace_strategy_reports(
+            session,
+            workspace_ids=[workspace_id, empty_workspace_id],
+        )
+        assert reports[workspace_id] == report
+        assert reports[empty_workspace_id] == {
+            "workspace_id": empty_workspace_id,
+            "available": False,
+            "watchlist_count": 0,
+        }
+
+
+def test_strategy_discovery_reports_per_user_fetch_failures(monkeypatch) -> None:
+    monkeypatch.setenv("TOKEN_ENCRYPTION_KEY", "Y4Cpe2s2aQvRIvF8y17kF8s0w58K7tY6xE8DAXmXGJQ=")
+    get_settings.cache_clear()
+    get_token_key.cache_clear()
+
+    session_factory = _build_sqlite_session_factory()
+    workspace_id = str(uuid.uuid4())
+
+    try:
+        with session_factory() as session:
+            session.add(
+                Workspace(
+                    id=workspace_id,
+                    name=f"workspace-{uuid.uuid4()}",
+                    plan="free",
+                    subscription_status="active",
+                )
+            )
+            session.commit()
+            upsert_workspace_x_tokens(
+                session,
+                workspace_id=workspace_id,
+                access_token="workspace-access-token",
+                refresh_token="workspace-refresh-token",
+                scope="tweet.read users.read",
+            )
+
+            result = run_workspace_strategy_discovery(
+                session,
+                workspace_id=workspace_id,
+                x_client=_FakePartialFailureStrategyDiscoveryXClient(),
+            )
+            assert result["status"] == "discovered"
+            assert result["scanned_users"] == 2
+            assert result["errors"] == ["user_metrics_failed:5001", "user_posts_failed:5002"]
+            assert result["candidates"] == []
+    finally:
+        get_token_key.cache_clear()
+        get_settings.cache_clear()
+
+
+def test_strategy_discovery_skips_x_lookups_for_low_signal_users(monkeypatch) -> None:
+    monkeypatch.setenv("TOKEN_ENCRYPTION_KEY", "Y4Cpe2s2aQvRIvF8y17kF8s0w58K7tY6xE8DAXmXGJQ=")
+    get_settings.cache_clear()
+    get_token_key.cache_clear()
+
+    session_factory = _build_sqlite_session_factory()
+    workspace_id = str(uuid.uuid4())
+
+    try:
+        with session_factory() as session:
+            session.add(
+                Workspace(
+                    id=workspace_id,
+                    name=f"workspace-{uuid.uuid4()}",
+                    plan="free",
+                    subscription_status="active",
+                )
+            )
+            session.commit()
+            upsert_workspace_x_tokens(
+                session,
+                workspace_id=workspace_id,
+                access_token="workspace-access-token",
+                refresh_token="workspace-refresh-token",
+                scope="tweet.read users.read",
+            )
+
+            result = run_workspace_strategy_discovery(
+                session,
+                workspace_id=workspace_id,
+                x_client=_FakeLowSignalStrategyDiscoveryXClient(),
+            )
+            assert result["status"] == "discovered"
+            assert result["scanned_users"] == 2
+            assert result["quality_rejected"] == 0
+            assert result["rejected_by_reason"] == {"prefilter_signal_post_count": 2}
+            assert result["errors"] == []
+            assert result["candidates"] == []
+    finally:
+        get_token_key.cache_clear()
+        get_settings.cache_clear()
+
+
+def test_strategy_discovery_keeps_prefiltered_users_out_of_quality_counts(monkeypatch) -> None:
+    monkeypatch.setenv("TOKEN_ENCRYPTION_KEY", "Y4Cpe2s2aQvRIvF8y17kF8s0w58K7tY6xE8DAXmXGJQ=")
+    get_settings.cache_clear()
+    get_token_key.cache_clear()
+
+    session_factory = _build_sqlite_session_factory()
+    workspace_id = str(uuid.uuid4())
+
+    try:
+        with session_factory() as session:
+            session.add(
+                Workspace(
+                    id=workspace_id,
+                    name=f"workspace-{uuid.uuid4()}",
+                    plan="free",
+                    subscription_status="active",
+                )
+            )
+            session.commit()
+            upsert_workspace_x_tokens(
+                session,
+                workspace_id=workspace_id,
+                access_token="workspace-access-token",
+                refresh_token="workspace-refresh-token",
+                scope="tweet.read users.read",
+            )
+
+            result = run_workspace_strategy_discovery(
+                session,
+                workspace_id=workspace_id,
+                x_client=_FakeMixedSignalStrategyDiscoveryXClient(),
+            )
+            assert result["scanned_users"] == 3
+            # Only the account that reached the quality checks counts as quality_rejected.
+            assert result["quality_rejected"] == 1
+            reasons = result["rejected_by_reason"]
+            assert reasons["prefilter_signal_post_count"] == 1
+            assert reasons["min_followers"] == 1
+            assert "signal_post_count" not in reasons
+            assert reasons["score"] == 1
+            assert result["candidates"] == []
+    finally:
+        get_token_key.cache_clear()
+        get_settings.cache_clear()
+
+def test_strategy_discovery_updates_existing_and_prunes_stale_pending(monkeypatch) -> None:
+    monkeypatch.setenv("TOKEN_ENCRYPTION_KEY", "Y4Cpe2s2aQvRIvF8y17kF8s0w58K7tY6xE8DAXmXGJQ=")
+    get_settings.cache_clear()
+    get_token_key.cache_clear()
+
+    session_factory = _build_sqlite_session_factory()
+    workspace_id = str(uuid.uuid4())
+    existing_id = str(uuid.uuid4())
+    stale_id = str(uuid.uuid4())
+
+    try:
+        with session_factory() as session:
+            session.add(
+                Workspace(
+                    id=workspace_id,
+                    name=f"workspace-{uuid.uuid4()}",
+                    plan="free",
+                    subscription_status="active",
+                )
+            )
+            session.add(
+                XStrategyDiscoveryCandidate(
+                    id=existing_id,
+                    workspace_id=workspace_id,
+                    account_user_id="1001",
+                    score=10,
+                    status="pending",
+                )
+            )
+            session.add(
+                XStrategyDiscoveryCandidate(
+                    id=stale_id,
+                    workspace_id=workspace_id,
+                    account_user_id="9999",
+                    score=90,
+                    status="pending",
+                )
+            )
+            session.commit()
+            upsert_workspace_x_tokens(
+                session,
+                workspace_id=workspace_id,
+                access_token="workspace-access-token",
+                refresh_token="workspace-refresh-token",
+                scope="tweet.read users.read",
+            )
+
+            result = run_workspace_strategy_discovery(
+                session,
+                workspace_id=workspace_id,
+                x_client=_FakeStrategyDiscoveryXClient(),
+            )
+            assert result["discovered"] == 0
+            assert result["updated"] == 1
+            assert result["pruned_pending"] == 1
+            assert result["pending_count"] == 1
+            assert [entry["candidate_id"] for entry in result["candidates"]] == [existing_id]
+
+            session.expire_all()
+            assert session.get(XStrategyDiscoveryCandidate, existing_id).score > 10
+            assert session.get(XStrategyDiscoveryCandidate, stale_id).status == "rejected_auto"
+    finally:
+        get_token_key.cache_clear()
+        get_settings.cache_clear()
+
+
+def test_strategy_scan_upserts_competitor_posts(monkeypatch) -> None:
+    monkeypatch.setenv("TOKEN_ENCRYPTION_KEY", "Y4Cpe2s2aQvRIvF8y17kF8s0w58K7tY6xE8DAXmXGJQ=")
+    get_settings.cache_clear()
+    get_token_key.cache_clear()
+
+    session_factory = _build_sqlite_session_factory()
+    workspace_id = str(uuid.uuid4())
+    fake_x = _FakeStrategyScanXClient()
+
+    try:
+        with session_factory() as session:
+            session.add(
+                Workspace(
+                    id=workspace_id,
+                    name=f"workspace-{uuid.uuid4()}",
+                    plan="free",
+                    subscription_status="active",
+                )
+            )
+            session.commit()
+            upsert_workspace_x_tokens(
+                session,
+                workspace_id=workspace_id,
+                access_token="workspace-access-token",
+                refresh_token="workspace-refresh-token",
+                scope="tweet.read users.read",
+            )
+            upsert_watchlist_account(
+                session,
+                workspace_id=workspace_id,
+                account_user_id="1001",
+                account_username="Tobby_scraper",
+            )
+            upsert_watchlist_account(
+                session,
+                workspace_id=workspace_id,
+                account_user_id="1002",
+                account_username="timeline_down",
+            )
+
+            first = run_workspace_strategy_scan(session, workspace_id=workspace_id, x_client=fake_x)
+            assert first["status"] == "scanned"
+            assert first["ingested_posts"] == 2
+            assert first["errors"] == ["user_scan_failed:1002"]
+            assert first["pattern"]["total_posts"] == 2
+            assert first["pattern"]["accounts_analyzed"] == 1
+            assert first["pattern"]["avg_engagement"] == 2.0
+            assert first["pattern"]["avg_text_length"] == 32.0
+            assert first["pattern"]["image_rate"] == 0.0
+            assert first["pattern"]["top_openers"] == ["shipping the onboarding flow", "what broke in our"]
+            assert first["pattern"]["best_hours_utc"] == [0, 6]
+            assert first["recommendations"] == [
+                "Aumentar cadencia de publicacao para reduzir janelas sem distribuicao.",
+                "Priorizar copy clara e curta; testar imagem apenas em posts de maior potencial.",
+                "Ajustar hooks de abertura e iterar temas com mais dor explicita de founders.",
+                "Testar abertura inspirada em: 'shipping the onboarding flow'.",
+                "Priorizar janela UTC: 0, 6.",
+            ]
+
+            fake_x.like_count = 40
+            second = run_workspace_strategy_scan(session, workspace_id=workspace_id, x_client=fake_x)
+            assert second["ingested_posts"] == 2
+
+            posts = {
+                row.external_post_id: row
+                for row in session.scalars(
+                    select(XCompetitorPost).where(XCompetitorPost.workspace_id == workspace_id)
+                ).all()
+            }
+            assert sorted(posts) == ["p1", "p2"]
+            assert posts["p1"].like_count == 40
+            assert posts["p1"].watched_account_username == "Tobby_scraper"
+    finally:
+        get_token_key.cache_clear()
+        get_settings.cache_clear()
+
+
+def test_upsert_watchlist_accounts_batches_inserts_and_updates() -> None:
+    session_factory = _build_sqlite_session_factory()
+    workspace_id = str(uuid.uuid4())
+
+    with session_factory() as session:
+        session.add(
+            Workspace(
+                id=workspace_id,
+                name=f"workspace-{uuid.uuid4()}",
+                plan="free",
+                subscription_status="active",
+            )
+        )
+        session.commit()
+        existing = upsert_watchlist_account(session, workspace_id=workspace_id, account_user_id="1001")
+        existing.status = "paused"
+        session.commit()
+
+        rows = upsert_watchlist_accounts(
+            session,
+            workspace_id=workspace_id,
+            accounts=[
+                {"account_user_id": " 1001 ", "account_username": "Tobby_scraper"},
+                {"account_user_id": "1002", "account_username": ""},
+                {"account_user_id": "1002", "account_username": "second_pass"},
+            ],
+        )
+
+        assert rows[0].id == existing.id
+        assert rows[0].status == "active"
+        assert rows[0].account_username == "Tobby_scraper"
+        assert rows[1] is rows[2]
+        assert rows[2].account_username == "second_pass"
+        report = latest_workspace_strategy_report(session, workspace_id=workspace_id)
+        assert report["watchlist_count"] == 2
+
+
+def test_strategy_discovery_criteria_follow_in_place_settings_changes(monkeypatch) -> None:
+    get_settings.cache_clear()
+    try:
+        settings = get_settings()
+        monkeypatch.setattr(settings, "x_strategy_candidate_min_score", 40)
+        assert get_strategy_discovery_criteria(settings=settings).min_score == 40
+
+        monkeypatch.setattr(settings, "x_strategy_candidate_min_score", 90)
+        assert get_strategy_discovery_criteria(settings=settings).min_score == 90
+    finally:
+        get_settings.cache_clear()